@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Load test for the tracker API
+Serves a scratch plan in a temporary directory and drives it with concurrent keep-alive clients
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+
+from career_tracker import EnhancedCybersecurityTracker
+from career_tracker.api import TrackerAPI
+
+CLIENTS = 50
+REQUESTS_PER_CLIENT = 200
+TASKS = 2_000
+WRITE_EVERY = 20  # One POST per this many requests per client; the rest are GETs
+READ_PATHS = ["/summary", "/today", "/week/1", "/behind"]
+
+
+def write_plan(count: int):
+    """Write a synthetic my_schedule.json into the current directory"""
+    tasks = [{"id": i, "title": f"Practice lab {i}", "hours": 1.5, "day": i % 42 + 1, "done": False, "created_order": i}
+             for i in range(count)]
+    with open("my_schedule.json", "w", encoding="utf-8") as f:
+        json.dump({"tasks": tasks}, f)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port: int) -> TrackerAPI:
+    """Serve the plan in the current directory from a background thread"""
+    with redirect_stdout(open(os.devnull, "w")):
+        tracker = EnhancedCybersecurityTracker()
+    tracker.enable_background_saves()
+    api = TrackerAPI(tracker)
+    ready = threading.Event()
+    threading.Thread(target=lambda: asyncio.run(api.serve("127.0.0.1", port, ready.set)), daemon=True).start()
+    ready.wait()
+    return api
+
+
+async def client(port: int, index: int, requests: int, task_count: int, latencies: list, errors: list):
+    """Send requests over one keep-alive connection and record each round trip"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for i in range(requests):
+        if i % WRITE_EVERY == WRITE_EVERY - 1:
+            path = f"/tasks/{(index * requests + i) % task_count}/toggle"
+            request = f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: 0\r\n\r\n"
+        else:
+            path = READ_PATHS[i % len(READ_PATHS)]
+            request = f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n"
+
+        start = time.perf_counter()
+        writer.write(request.encode("latin-1"))
+        status = (await reader.readline()).split()[1]
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+        if status != b"200":
+            errors.append((path, status.decode()))
+    writer.close()
+
+
+async def run_load(port: int, clients: int, requests: int, task_count: int):
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, i, requests, task_count, latencies, errors) for i in range(clients)))
+    return time.perf_counter() - start, latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=CLIENTS)
+    parser.add_argument("--requests", type=int, default=REQUESTS_PER_CLIENT, help="requests per client")
+    parser.add_argument("--tasks", type=int, default=TASKS, help="tasks in the scratch plan")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        write_plan(args.tasks)
+        port = free_port()
+        api = start_server(port)
+        elapsed, latencies, errors = asyncio.run(run_load(port, args.clients, args.requests, args.tasks))
+        api.close()
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"📊 {total:,} requests from {args.clients} clients against {args.tasks:,} tasks in {elapsed:.2f}s")
+    print(f"   throughput: {total / elapsed:,.0f} req/s")
+    print(f"   latency:    p50 {statistics.median(latencies) * 1000:.2f}ms  "
+          f"p99 {latencies[int(total * 0.99) - 1] * 1000:.2f}ms  max {latencies[-1] * 1000:.2f}ms")
+    if errors:
+        print(f"⚠️ {len(errors)} non-200 responses, first: {errors[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for cohort analytics
+Writes synthetic plan files to a temporary directory and times the analysis with 1..N worker processes
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import tempfile
+import time
+from datetime import date, timedelta
+
+from career_tracker.cohort import CohortReport, find_plan_files, iter_plan_results
+
+PLANS = 400
+TASKS_PER_PLAN = 300
+TITLES = ["Apply to SOC analyst role", "Study network protocols", "TryHackMe lab", "Update GitHub portfolio",
+          "LinkedIn networking outreach", "Mock interview practice", "Follow up with recruiter", "Read security blog"]
+
+
+def write_plans(root: str, plans: int, tasks: int):
+    """Write one my_schedule.json per synthetic user, with varied start dates and progress"""
+    rng = random.Random(0)
+    for user in range(plans):
+        path = os.path.join(root, f"user{user:05d}")
+        os.makedirs(path)
+        progress = rng.random()
+        records = [{"id": i, "title": f"{rng.choice(TITLES)} {i}", "hours": 1.5, "day": i % 42 + 1,
+                    "done": rng.random() < progress, "created_order": i} for i in range(tasks)]
+        start = (date.today() - timedelta(days=rng.randrange(60))).isoformat()
+        with open(os.path.join(path, "my_schedule.json"), "w", encoding="utf-8") as f:
+            json.dump({"start_date": start, "total_days": 42, "skip_days": [5, 6], "tasks": records}, f)
+
+
+def run(root: str, workers: int) -> tuple:
+    report = CohortReport()
+    start = time.perf_counter()
+    for result in iter_plan_results(find_plan_files([root]), workers):
+        report.add(result)
+    return time.perf_counter() - start, report.to_dict()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--plans", type=int, default=PLANS)
+    parser.add_argument("--tasks", type=int, default=TASKS_PER_PLAN, help="tasks per plan")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    worker_counts = sorted({1, *(2 ** i for i in range(1, args.max_workers.bit_length())), args.max_workers})
+    with tempfile.TemporaryDirectory() as root:
+        write_plans(root, args.plans, args.tasks)
+        print(f"👥 {args.plans} plans x {args.tasks} tasks, {os.cpu_count()} CPUs")
+        print(f"{'workers':>8} {'time':>8} {'plans/s':>9} {'speedup':>8}")
+        baseline = None
+        for workers in worker_counts:
+            elapsed, cohort = run(root, workers)
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>7.2f}s {cohort['plans'] / elapsed:>9.0f} {baseline / elapsed:>7.2f}x")
+
+    # The parent only ever holds running totals and the chunks in flight
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"📈 {cohort['completed']}/{cohort['total_tasks']} tasks completed, {cohort['behind']} behind; "
+          f"parent peak RSS {peak_kb / 1024:.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark using python -X importtime
+Compares importing the tracker core with importing the GUI module, which loads Tk
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Module imported -> what it stands for
+TARGETS = [
+    ("career_tracker", "tracker core (CLI, scripts)"),
+    ("enhanced_cybersecurity_tracker", "app launcher module"),
+    ("career_tracker.gui", "GUI module (the old top-level import)")
+]
+RUNS = 5
+
+
+def import_profile(module: str):
+    """Get (total self-time of all imports in microseconds, imported module names) for one import"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    total = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        # import time:       self [us] |  cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        total += int(self_us)
+        modules.add(name.strip())
+    return total, modules
+
+
+def wall_time(module: str) -> float:
+    """Get the median wall-clock seconds to start an interpreter and import module"""
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", f"import {module}"], check=True,
+                       cwd=os.path.dirname(os.path.abspath(__file__)))
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    print(f"{'module':<32} {'imports':>10} {'startup':>9} {'tkinter':>8}")
+    for module, label in TARGETS:
+        total, modules = import_profile(module)
+        loads_tk = "yes" if "tkinter" in modules else "no"
+        print(f"{module:<32} {total / 1000:>8.1f}ms {wall_time(module) * 1000:>7.1f}ms {loads_tk:>8}  {label}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the task representations
+Compares the Task dataclass with the slotted CompactTask for 10k, 100k and 1M tasks
+"""
+
+import sys
+import tracemalloc
+from dataclasses import asdict
+
+from career_tracker.core import Task, CompactTask, TaskStatus
+
+SIZES = [10_000, 100_000, 1_000_000]
+CATEGORIES = ["Applications", "Study", "Practical Labs", "Networking", "Portfolio", "Interview Prep", "Follow-up", "General"]
+STATUSES = list(TaskStatus)
+
+
+def build_tasks(task_class, count: int) -> list:
+    """Build count tasks the way the loader does, with a fresh category string per task like a JSON parse"""
+    tasks = []
+    for i in range(count):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        tasks.append(task_class(
+            id=i,
+            title=f"Task {i}",
+            hours=1.5,
+            day=i % 42 + 1,
+            done=i % 3 == 0,
+            created_order=i,
+            status=STATUSES[i % len(STATUSES)],
+            notes="",
+            completed_date=None,
+            category=(category + " ")[:-1]
+        ))
+    return tasks
+
+
+def measure(task_class, count: int) -> int:
+    """Get the bytes allocated to hold count tasks"""
+    tracemalloc.start()
+    tasks = build_tasks(task_class, count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks
+    return current
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+
+    # Both representations must serialize identically
+    assert asdict(build_tasks(Task, 1)[0]) == asdict(build_tasks(CompactTask, 1)[0])
+
+    print(f"{'tasks':>10} {'Task':>10} {'per task':>9} {'CompactTask':>12} {'per task':>9} {'saved':>6}")
+    for count in sizes:
+        plain = measure(Task, count)
+        compact = measure(CompactTask, count)
+        print(f"{count:>10,} {plain / 2**20:>8.1f}MB {plain / count:>8.0f}B "
+              f"{compact / 2**20:>10.1f}MB {compact / count:>8.0f}B {1 - compact / plain:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
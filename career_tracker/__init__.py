@@ -0,0 +1,6 @@
+"""
+Career development tracker core: task model, storage and working-day calendar
+Nothing in this package imports tkinter except career_tracker.gui
+"""
+
+from .core import EnhancedCybersecurityTracker, Task, CompactTask, TaskStatus, STATUS_EMOJI
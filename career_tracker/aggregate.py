@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Grouped counts and hour sums over task columns
+Uses NumPy bincount when it is installed and a single pure-Python pass otherwise
+"""
+
+from itertools import compress
+from typing import Dict, List, Sequence, Tuple
+
+from .snapshot import STATUS_CODES, STATUS_INDEX
+
+try:
+    import numpy as np
+except ImportError:
+    # Optional: the fallback returns the same numbers
+    np = None
+
+DAYS_PER_WEEK = 7
+
+
+def grouped_sums(codes: Sequence[int], hours: Sequence[float], done: bytes,
+                 size: int) -> Tuple[List[int], List[int], List[float], List[float]]:
+    """Get (totals, completed, hours, completed hours) per code for codes in range(size)"""
+    if np is not None:
+        codes = np.asarray(codes, dtype=np.intp)
+        hours = np.asarray(hours, dtype=np.float64)
+        done_mask = np.frombuffer(done, dtype=np.uint8).astype(bool)
+        return (
+            np.bincount(codes, minlength=size).tolist(),
+            np.bincount(codes[done_mask], minlength=size).tolist(),
+            np.bincount(codes, weights=hours, minlength=size).tolist(),
+            np.bincount(codes[done_mask], weights=hours[done_mask], minlength=size).tolist()
+        )
+
+    totals = [0] * size
+    completed = [0] * size
+    hour_sums = [0.0] * size
+    completed_hours = [0.0] * size
+    for code, task_hours, task_done in zip(codes, hours, done):
+        totals[code] += 1
+        hour_sums[code] += task_hours
+        if task_done:
+            completed[code] += 1
+            completed_hours[code] += task_hours
+    return totals, completed, hour_sums, completed_hours
+
+
+def group_stats(keys: Sequence, codes: Sequence[int], hours: Sequence[float], done: bytes) -> Dict:
+    """Get the per-group stats dicts used by the progress summary, keyed by keys[code]"""
+    totals, completed, hour_sums, completed_hours = grouped_sums(codes, hours, done, len(keys))
+    return {
+        key: {
+            "total": totals[code],
+            "completed": completed[code],
+            "hours": hour_sums[code],
+            "completed_hours": completed_hours[code]
+        }
+        for code, key in enumerate(keys) if totals[code]
+    }
+
+
+def _offset_codes(values: Sequence[int], divisor: int = 1) -> Tuple[Sequence[int], List[int]]:
+    """Map day numbers (or weeks of them) onto dense non-negative codes; returns (codes, keys)"""
+    if not len(values):
+        return [], []
+    if np is not None:
+        groups = (np.asarray(values, dtype=np.intp) - 1) // divisor + 1
+        low = int(groups.min())
+        return groups - low, list(range(low, int(groups.max()) + 1))
+    groups = [(value - 1) // divisor + 1 for value in values]
+    low = min(groups)
+    return [group - low for group in groups], list(range(low, max(groups) + 1))
+
+
+def progress_summary(columns: Dict, categories: List[str]) -> Dict:
+    """Compute the tracker's progress summary from task columns"""
+    total_tasks = len(columns["id"])
+    status = bytes(columns["status"])
+    done = bytes(columns["done"])
+    hours = columns["hours"]
+    completed = status.count(STATUS_INDEX["completed"])
+    in_progress = status.count(STATUS_INDEX["in_progress"])
+    pending = status.count(STATUS_INDEX["pending"])
+
+    if np is not None:
+        hours_array = np.asarray(hours, dtype=np.float64)
+        total_hours = float(hours_array.sum())
+        completed_hours = float(hours_array[np.frombuffer(done, dtype=np.uint8).astype(bool)].sum())
+    else:
+        total_hours = sum(hours)
+        completed_hours = sum(compress(hours, done))
+
+    return {
+        "total_tasks": total_tasks,
+        "completed": completed,
+        "in_progress": in_progress,
+        "pending": pending,
+        "completion_percentage": round((completed / total_tasks) * 100, 1) if total_tasks > 0 else 0,
+        "total_hours": total_hours,
+        "completed_hours": completed_hours,
+        "hours_percentage": round((completed_hours / total_hours) * 100, 1) if total_hours > 0 else 0,
+        "categories": group_stats(categories, columns["category"], hours, done)
+    }
+
+
+def progress_report(columns: Dict, categories: List[str]) -> Dict:
+    """Get the progress summary plus per-status, per-day and per-week breakdowns"""
+    report = progress_summary(columns, categories)
+    hours = columns["hours"]
+    done = bytes(columns["done"])
+
+    report["statuses"] = group_stats(STATUS_CODES, columns["status"], hours, done)
+    day_codes, days = _offset_codes(columns["day"])
+    report["days"] = group_stats(days, day_codes, hours, done)
+    week_codes, weeks = _offset_codes(columns["day"], DAYS_PER_WEEK)
+    report["weeks"] = group_stats(weeks, week_codes, hours, done)
+    return report
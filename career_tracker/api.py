@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Local HTTP/JSON API for the tracker, built on asyncio streams
+Reads are answered from cached, pre-serialized responses; every tracker call runs on one
+worker thread, so writes are serialized and never overlap a read of the same state
+"""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Callable, Dict, Optional, Tuple
+
+from .core import EnhancedCybersecurityTracker
+
+# Configuration
+API_HOST = "127.0.0.1"  # Local only; the API has no authentication
+API_PORT = 8765
+SNAPSHOT_TTL = 30.0  # Seconds before a cached read is rebuilt even without writes (today's tasks move with the date)
+MAX_BODY_BYTES = 64 * 1024
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class TrackerAPI:
+    def __init__(self, tracker: EnhancedCybersecurityTracker, snapshot_ttl: float = SNAPSHOT_TTL):
+        self.tracker = tracker
+        self.snapshot_ttl = snapshot_ttl
+        # One thread owns the tracker: writes queue up behind each other and behind snapshot builds
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tracker-api")
+        self._snapshot: Dict[str, Tuple[float, bytes]] = {}
+        self._version = 0
+
+    # Reads
+
+    async def read(self, key: str, build: Callable[[], object]) -> bytes:
+        """Get a cached JSON response, building it on the tracker thread when missing or stale"""
+        cached = self._snapshot.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.snapshot_ttl:
+            return cached[1]
+
+        version = self._version
+        body = await asyncio.get_running_loop().run_in_executor(self._executor, self._serialize, build)
+        # A write that landed meanwhile has already invalidated the cache; do not resurrect old data
+        if version == self._version:
+            self._snapshot[key] = (time.monotonic(), body)
+        return body
+
+    def _serialize(self, build: Callable[[], object]) -> bytes:
+        return json.dumps(build(), separators=(",", ":")).encode('utf-8')
+
+    def _records(self, tasks) -> list:
+        return self.tracker.get_task_records(tasks)
+
+    # Writes
+
+    async def write(self, change: Callable[[], bool]) -> bool:
+        """Apply one tracker mutation on the tracker thread and drop every cached read"""
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, change)
+        finally:
+            # Even a failed save may have changed the in-memory tasks, so no cached read is trusted
+            self._version += 1
+            self._snapshot.clear()
+
+    # Routing
+
+    async def handle(self, method: str, path: str, body: bytes) -> Tuple[HTTPStatus, bytes]:
+        """Dispatch one request; returns (status, JSON body)"""
+        parts = [part for part in path.split("?", 1)[0].split("/") if part]
+        tracker = self.tracker
+
+        if method == "GET":
+            if parts == ["summary"]:
+                return HTTPStatus.OK, await self.read("summary", tracker.get_progress_summary)
+            if parts == ["today"]:
+                return HTTPStatus.OK, await self.read("today", lambda: self._records(tracker.get_today_tasks()))
+            if parts == ["behind"]:
+                return HTTPStatus.OK, await self.read("behind", lambda: self._records(tracker.get_behind_schedule_tasks()))
+            if len(parts) == 2 and parts[0] == "week":
+                week = self._int(parts[1])
+                return HTTPStatus.OK, await self.read(f"week/{week}", lambda: self._records(tracker.get_week_tasks(week)))
+            if len(parts) == 2 and parts[0] == "tasks":
+                task_id = self._int(parts[1])
+                response = await self.read(f"tasks/{task_id}", lambda: self._task(task_id))
+                if response == b"null":
+                    raise HTTPError(HTTPStatus.NOT_FOUND, f"No task with id {task_id}")
+                return HTTPStatus.OK, response
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown path {path}")
+
+        if method == "POST" and len(parts) == 3 and parts[0] == "tasks":
+            task_id = self._int(parts[1])
+            payload = self._json(body)
+            actions = {
+                "complete": lambda: tracker.mark_task_complete(task_id, str(payload.get("notes", ""))),
+                "in-progress": lambda: tracker.mark_task_in_progress(task_id),
+                "toggle": lambda: tracker.toggle_task_status(task_id),
+                "notes": lambda: tracker.update_task_notes(task_id, str(payload.get("notes", "")))
+            }
+            action = actions.get(parts[2])
+            if action is None:
+                raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown action {parts[2]}")
+            if not await self.write(action):
+                raise HTTPError(HTTPStatus.NOT_FOUND, f"No task with id {task_id}")
+            return HTTPStatus.OK, await self.read(f"tasks/{task_id}", lambda: self._task(task_id))
+
+        raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} not allowed on {path}")
+
+    def _task(self, task_id: int) -> Optional[Dict]:
+        task = self.tracker.get_task(task_id)
+        return self.tracker.get_task_records([task])[0] if task is not None else None
+
+    @staticmethod
+    def _int(value: str) -> int:
+        try:
+            return int(value)
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Expected a number, got {value!r}")
+
+    @staticmethod
+    def _json(body: bytes) -> Dict:
+        if not body:
+            return {}
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Request body is not valid JSON")
+        if not isinstance(payload, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Request body must be a JSON object")
+        return payload
+
+    # HTTP
+
+    async def serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve HTTP/1.1 requests on one connection until the client closes it"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, b'{"error":"Malformed request line"}', False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode('latin-1').partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, b'{"error":"Bad Content-Length"}', False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, b'{"error":"Body too large"}', False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    status, response = await self.handle(method, path, body)
+                except HTTPError as e:
+                    status, response = e.status, json.dumps({"error": str(e)}).encode('utf-8')
+                except Exception as e:
+                    status, response = HTTPStatus.INTERNAL_SERVER_ERROR, json.dumps({"error": str(e)}).encode('utf-8')
+                await self._respond(writer, status, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: HTTPStatus, body: bytes, keep_alive: bool):
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + body
+        )
+        await writer.drain()
+
+    async def serve(self, host: str = API_HOST, port: int = API_PORT, ready: Optional[Callable[[], None]] = None):
+        """Run the server until cancelled"""
+        server = await asyncio.start_server(self.serve_connection, host, port)
+        print(f"🌐 Tracker API listening on http://{host}:{port}")
+        if ready is not None:
+            ready()
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        """Wait for queued tracker calls to finish"""
+        self._executor.shutdown(wait=True)
+
+
+def run_server(tracker: EnhancedCybersecurityTracker, host: str = API_HOST, port: int = API_PORT):
+    """Serve the API in the foreground until interrupted"""
+    # Journal compactions happen on the background writer instead of inside a request
+    tracker.enable_background_saves()
+    api = TrackerAPI(tracker)
+    try:
+        asyncio.run(api.serve(host, port))
+    except KeyboardInterrupt:
+        print("👋 Tracker API stopped")
+    finally:
+        api.close()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Deduplicated, compressed backup store with retention policies
+Backups are gzip blobs named by content hash and listed in a small manifest
+"""
+
+import glob
+import gzip
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+# Configuration
+BACKUP_KEEP_LAST = 20     # Always keep the most recent backups
+BACKUP_KEEP_HOURLY = 24   # Plus the newest backup of each of the last N hours
+BACKUP_KEEP_DAILY = 30    # Plus the newest backup of each of the last N days
+MANIFEST_FILE = "manifest.json"
+BLOB_DIR = "blobs"
+BLOB_SUFFIX = ".gz"
+CHUNK_SIZE = 64 * 1024
+
+
+class BackupStore:
+    def __init__(self, backup_dir: str, keep_last: int = BACKUP_KEEP_LAST,
+                 keep_hourly: int = BACKUP_KEEP_HOURLY, keep_daily: int = BACKUP_KEEP_DAILY):
+        self.backup_dir = backup_dir
+        self.blob_dir = os.path.join(backup_dir, BLOB_DIR)
+        self.manifest_path = os.path.join(backup_dir, MANIFEST_FILE)
+        self.keep_last = keep_last
+        self.keep_hourly = keep_hourly
+        self.keep_daily = keep_daily
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.entries = self._load_manifest()
+
+    def _load_manifest(self) -> List[Dict]:
+        if not os.path.exists(self.manifest_path):
+            return []
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get("backups", [])
+        except (OSError, ValueError) as e:
+            print(f"❌ Error reading backup manifest: {e}")
+            return []
+
+    def _save_manifest(self):
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"backups": self.entries}, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, f"{digest}{BLOB_SUFFIX}")
+
+    def backup(self, content: str, timestamp: Optional[datetime] = None) -> Optional[str]:
+        """Store a backup of the serialized state; returns its hash, or None if unchanged"""
+        raw = content.encode('utf-8')
+        digest = hashlib.sha256(raw).hexdigest()
+        if self.entries and self.entries[-1]["hash"] == digest:
+            return None
+
+        blob_path = self._blob_path(digest)
+        if not os.path.exists(blob_path):
+            tmp_path = f"{blob_path}.tmp"
+            with gzip.open(tmp_path, 'wb') as f:
+                f.write(raw)
+            os.replace(tmp_path, blob_path)
+        return self._add_entry(digest, len(raw), timestamp)
+
+    def backup_file(self, path: str) -> Optional[str]:
+        """Store a backup of a state file, reading it in chunks; returns its hash, or None if unchanged"""
+        sha = hashlib.sha256()
+        size = 0
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                sha.update(chunk)
+                size += len(chunk)
+        digest = sha.hexdigest()
+        if self.entries and self.entries[-1]["hash"] == digest:
+            return None
+
+        blob_path = self._blob_path(digest)
+        if not os.path.exists(blob_path):
+            tmp_path = f"{blob_path}.tmp"
+            with open(path, 'rb') as src, gzip.open(tmp_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            os.replace(tmp_path, blob_path)
+        return self._add_entry(digest, size)
+
+    def _add_entry(self, digest: str, size: int, timestamp: Optional[datetime] = None) -> str:
+        timestamp = timestamp or datetime.now()
+        self.entries.append({"time": timestamp.isoformat(), "hash": digest, "size": size})
+        self.entries.sort(key=lambda entry: entry["time"])
+        self._apply_retention()
+        self._save_manifest()
+        return digest
+
+    def _apply_retention(self, now: Optional[datetime] = None):
+        """Drop manifest entries outside the retention policy and delete unreferenced blobs"""
+        now = now or datetime.now()
+        keep = set(range(max(0, len(self.entries) - self.keep_last), len(self.entries)))
+
+        hourly_cutoff = now - timedelta(hours=self.keep_hourly)
+        daily_cutoff = now - timedelta(days=self.keep_daily)
+        seen_hours = set()
+        seen_days = set()
+        for index in range(len(self.entries) - 1, -1, -1):
+            moment = datetime.fromisoformat(self.entries[index]["time"])
+            hour = moment.strftime("%Y%m%d%H")
+            day = moment.strftime("%Y%m%d")
+            if moment >= hourly_cutoff and hour not in seen_hours:
+                seen_hours.add(hour)
+                keep.add(index)
+            if moment >= daily_cutoff and day not in seen_days:
+                seen_days.add(day)
+                keep.add(index)
+
+        self.entries = [entry for index, entry in enumerate(self.entries) if index in keep]
+
+        referenced = {entry["hash"] for entry in self.entries}
+        for name in os.listdir(self.blob_dir):
+            if name.endswith(BLOB_SUFFIX) and name[:-len(BLOB_SUFFIX)] not in referenced:
+                os.remove(os.path.join(self.blob_dir, name))
+
+    def list_backups(self) -> List[Dict]:
+        """Get the retained backups, oldest first"""
+        return list(self.entries)
+
+    def read(self, digest: str) -> str:
+        """Get the serialized state stored under a hash"""
+        with gzip.open(self._blob_path(digest), 'rb') as f:
+            return f.read().decode('utf-8')
+
+    def restore(self, digest: str, path: str):
+        """Write a backup back out as an uncompressed state file"""
+        tmp_path = f"{path}.tmp"
+        with gzip.open(self._blob_path(digest), 'rb') as src, open(tmp_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+        os.replace(tmp_path, path)
+
+    def import_legacy_backups(self) -> int:
+        """Fold old backup_*.json files into the store and remove them"""
+        legacy = sorted(glob.glob(os.path.join(self.backup_dir, "backup_*.json")), key=os.path.getmtime)
+        for path in legacy:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            self.backup(content, datetime.fromtimestamp(os.path.getmtime(path)))
+            os.remove(path)
+        return len(legacy)
+
+
+if __name__ == "__main__":
+    store = BackupStore("backups")
+    count = store.import_legacy_backups()
+    print(f"✅ Imported {count} legacy backups; {len(store.entries)} retained")
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Keyword classifier for task categories
+The keyword table is compiled once into a single regex; the highest-priority category with a match wins
+Rules can be read from a JSON or TOML file and are recompiled when the file changes
+"""
+
+import json
+import os
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Configuration
+CATEGORY_RULES_FILE = "category_rules.json"
+CLASSIFIER_CACHE_SIZE = 4096
+DEFAULT_CATEGORY = "General"
+
+# Built-in rules, used when there is no rules file. Checked in order: a title matching keywords of several categories gets the first one
+CATEGORY_KEYWORDS: List[Tuple[str, List[str]]] = [
+    ("Applications", ["apply", "job", "application"]),
+    ("Study", ["security+", "study", "exam", "practice", "review"]),
+    ("Practical Labs", ["lab", "tryhackme", "siem", "network", "automation"]),
+    ("Networking", ["linkedin", "recruiter", "connect", "networking", "meetup"]),
+    ("Portfolio", ["resume", "github", "portfolio"]),
+    ("Interview Prep", ["interview", "mock", "star", "prep"]),
+    ("Follow-up", ["follow", "pipeline", "hygiene"])
+]
+
+
+class KeywordClassifier:
+    def __init__(self, rules: Sequence[Tuple[str, Sequence[str]]] = CATEGORY_KEYWORDS,
+                 default: str = DEFAULT_CATEGORY, cache_size: int = CLASSIFIER_CACHE_SIZE):
+        self.categories = [category for category, _ in rules]
+        self.default = default
+        self.rules = [[category, list(keywords)] for category, keywords in rules]
+
+        # Each keyword maps to the priority of the first category that lists it
+        self._priority = {}
+        for priority, (_, keywords) in enumerate(rules):
+            for keyword in keywords:
+                self._priority.setdefault(keyword.lower(), priority)
+
+        # The lookahead tries every start position without consuming text, so overlapping
+        # keywords are all seen; at each position the highest-priority alternative wins
+        ordered = sorted(self._priority, key=self._priority.get)
+        self._pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))") if ordered else None
+        self.classify = lru_cache(maxsize=cache_size)(self._classify)
+
+    def to_dict(self) -> Dict:
+        """Get the rules as plain data, e.g. to save next to the tasks they categorized"""
+        return {"default": self.default, "rules": self.rules}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "KeywordClassifier":
+        """Rebuild a classifier from to_dict() output"""
+        return cls([(category, keywords) for category, keywords in data["rules"]], data["default"])
+
+    def changed_keywords(self, old: "KeywordClassifier") -> Set[str]:
+        """Get the keywords whose titles may be categorized differently than under the old rules
+
+        A title that contains none of them gets the same category from both, unless it matches no keyword at
+        all and the default changed
+        """
+        ours = {keyword: self.categories[priority] for keyword, priority in self._priority.items()}
+        theirs = {keyword: old.categories[priority] for keyword, priority in old._priority.items()}
+        changed = {keyword for keyword in ours.keys() | theirs.keys() if ours.get(keyword) != theirs.get(keyword)}
+
+        # A title with keywords of two categories gets the higher-priority one, so two keywords whose
+        # priorities swapped are changed too
+        kept = [keyword for keyword in ours if keyword not in changed]
+        for a in kept:
+            for b in kept:
+                if (ours[a] != ours[b] and old._priority[a] < old._priority[b]
+                        and self._priority[a] > self._priority[b]):
+                    changed.update((a, b))
+        return changed
+
+    def _best_priority(self, text: str) -> int:
+        best = len(self.categories)
+        if self._pattern is None:
+            return best
+        for match in self._pattern.finditer(text):
+            priority = self._priority[match.group(1)]
+            if priority < best:
+                best = priority
+                if best == 0:
+                    break
+        return best
+
+    def _classify(self, title: str) -> str:
+        """Get the category for one title"""
+        best = self._best_priority(title.lower())
+        return self.categories[best] if best < len(self.categories) else self.default
+
+    def classify_many(self, titles: Iterable[str]) -> List[str]:
+        """Categorize many titles with a single scan over the distinct ones"""
+        titles = list(titles)
+        unique = list(dict.fromkeys(titles))  # Generated plans repeat titles a lot
+        lowered = [title.lower() for title in unique]
+
+        # Keywords never contain a newline, so no match can span two titles
+        starts = []
+        position = 0
+        for title in lowered:
+            starts.append(position)
+            position += len(title) + 1
+        text = "\n".join(lowered)
+
+        fallback = len(self.categories)
+        best = [fallback] * len(lowered)
+        if self._pattern is not None:
+            for match in self._pattern.finditer(text):
+                index = bisect_right(starts, match.start()) - 1
+                priority = self._priority[match.group(1)]
+                if priority < best[index]:
+                    best[index] = priority
+
+        categories = {title: self.categories[priority] if priority < fallback else self.default
+                      for title, priority in zip(unique, best)}
+        return [categories[title] for title in titles]
+
+
+def titles_with_keywords(titles: Iterable[str], keywords: Iterable[str]) -> Set[str]:
+    """Get the titles that contain any of the keywords (case-insensitive)"""
+    keywords = sorted(keywords)
+    if not keywords:
+        return set()
+    pattern = re.compile("|".join(map(re.escape, keywords)))
+    return {title for title in set(titles) if pattern.search(title.lower())}
+
+
+def load_category_rules(path: str) -> Tuple[List[Tuple[str, List[str]]], str]:
+    """Read a JSON or TOML rules file; returns (rules in priority order, default category)"""
+    if path.endswith(".toml"):
+        # Imported here so startup does not pay for the TOML parser when rules are JSON
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError("TOML category rules need Python 3.11 or newer")
+        with open(path, 'rb') as f:
+            data = tomllib.load(f)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    # Lower priority numbers are checked first; equal priorities keep their file order
+    rules = sorted(data.get("rules", []), key=lambda rule: rule.get("priority", 0))
+    return [(rule["category"], list(rule.get("keywords", []))) for rule in rules], data.get("default", DEFAULT_CATEGORY)
+
+
+class CategoryRules:
+    """Category rules from a file, recompiled whenever the file's mtime changes"""
+
+    def __init__(self, path: str = CATEGORY_RULES_FILE):
+        self.path = path
+        self.mtime: Optional[float] = None
+        self.classifier = KeywordClassifier()
+        self.reload_if_changed()
+
+    def reload_if_changed(self) -> bool:
+        """Recompile the rules if the file changed since the last check; returns True if they were replaced"""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            mtime = None  # No rules file: fall back to the built-in rules
+        if mtime == self.mtime:
+            return False
+        self.mtime = mtime
+
+        if mtime is None:
+            self.classifier = KeywordClassifier()
+            return True
+        try:
+            rules, default = load_category_rules(self.path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Keep the current rules until the file is fixed
+            print(f"❌ Error loading category rules from {self.path}: {e}")
+            return False
+        self.classifier = KeywordClassifier(rules, default)
+        return True
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Headless command-line interface for the tracker
+Never imports tkinter, so it runs from cron jobs and shell pipelines without a display
+
+    tracker today [--json]
+    tracker complete --id ID [--notes TEXT]
+    tracker summary [--json]
+    tracker import FILE
+    tracker export FILE
+    tracker serve [--host HOST] [--port PORT]
+    tracker rollup [WORKSPACE] [--json]
+    tracker cohort PATH... [--workers N] [--json] [--plans-out FILE.ndjson]
+
+Plan commands accept --plan-dir DIR to work on a plan outside the current directory
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+from typing import List, Optional
+
+from .core import EnhancedCybersecurityTracker, STATUS_EMOJI, SCHEDULE_FILE
+from .export import exporter_for, export_json
+from .workspace import PlanWorkspace, WORKSPACE_DIR
+
+
+def open_tracker(plan_dir: str = ".") -> EnhancedCybersecurityTracker:
+    """Load the plan, keeping the tracker's load messages out of stdout so it stays pipeable"""
+    with contextlib.redirect_stdout(sys.stderr):
+        return EnhancedCybersecurityTracker(plan_dir=plan_dir)
+
+
+def print_progress(written: int, total: Optional[int]):
+    """Show export progress on stderr"""
+    if total:
+        print(f"\r📤 {written}/{total} tasks ({written / total:.0%})", end="", file=sys.stderr, flush=True)
+
+
+def cmd_today(tracker: EnhancedCybersecurityTracker, args) -> int:
+    tasks = tracker.get_today_tasks()
+    if args.json:
+        json.dump(tracker.get_task_records(tasks), sys.stdout, indent=2)
+        print()
+        return 0
+
+    print(f"📅 Day {tracker.get_current_day()}/{tracker.total_days}: {len(tasks)} tasks")
+    for task in tasks:
+        print(f"{STATUS_EMOJI.get(task.status, '❓')} [{task.id}] {task.title} ({task.hours}h, {task.category})")
+    return 0
+
+
+def cmd_complete(tracker: EnhancedCybersecurityTracker, args) -> int:
+    if not tracker.mark_task_complete(args.id, args.notes):
+        print(f"❌ No task with id {args.id}", file=sys.stderr)
+        return 1
+    print(f"✅ Task {args.id} marked as completed!")
+    return 0
+
+
+def cmd_summary(tracker: EnhancedCybersecurityTracker, args) -> int:
+    summary = tracker.get_progress_summary()
+    if args.json:
+        json.dump(summary, sys.stdout, indent=2)
+        print()
+        return 0
+
+    print(f"📈 Tasks: {summary['completed']}/{summary['total_tasks']} ({summary['completion_percentage']}%)")
+    print(f"⏱️ Hours: {summary['completed_hours']:.1f}/{summary['total_hours']:.1f} ({summary['hours_percentage']}%)")
+    print(f"🔄 In progress: {summary['in_progress']}  ⏳ Pending: {summary['pending']}")
+    for category, stats in summary['categories'].items():
+        print(f"🏷️ {category}: {stats['completed']}/{stats['total']}")
+    return 0
+
+
+def cmd_import(tracker: EnhancedCybersecurityTracker, args) -> int:
+    with contextlib.redirect_stdout(sys.stderr):
+        count = tracker.import_plan(args.file)
+    print(f"✅ Imported {count} tasks from {args.file}")
+    return 0
+
+
+def cmd_export(tracker: EnhancedCybersecurityTracker, args) -> int:
+    export = exporter_for(args.file)
+    options = {"meta": tracker.get_export_meta()} if export is export_json else {}
+    progress = None if args.quiet else print_progress
+    count = export(args.file, tracker.iter_task_records(), len(tracker.tasks), progress=progress, **options)
+    if progress is not None:
+        print(file=sys.stderr)
+    print(f"✅ Exported {count} tasks to {args.file}")
+    return 0
+
+
+def cmd_serve(tracker: EnhancedCybersecurityTracker, args) -> int:
+    # Imported here so the other commands do not load asyncio
+    from .api import run_server
+    options = {name: value for name, value in (("host", args.host), ("port", args.port)) if value is not None}
+    run_server(tracker, **options)
+    return 0
+
+
+def cmd_rollup(args) -> int:
+    workspace = PlanWorkspace(args.workspace)
+    with contextlib.redirect_stdout(sys.stderr):
+        rollup = workspace.rollup()
+    if args.json:
+        json.dump(rollup, sys.stdout, indent=2)
+        print()
+        return 0
+
+    for plan in rollup['plans']:
+        behind = f"⚠️ {plan['behind']} behind" if plan['behind'] else "✅ on track"
+        print(f"📁 {plan['name']}: {plan['completed']}/{plan['total_tasks']} ({plan['completion_percentage']}%), "
+              f"day {plan['current_day']}/{plan['total_days']}, {behind}")
+    print(f"📈 {len(rollup['plans'])} plans: {rollup['completed']}/{rollup['total_tasks']} "
+          f"({rollup['completion_percentage']}%), {rollup['behind']} tasks behind in {rollup['plans_behind']} plans")
+    return 0
+
+
+def cmd_cohort(args) -> int:
+    # Imported here so the plan commands do not load multiprocessing
+    from .cohort import CohortReport, find_plan_files, iter_plan_results, CHUNK_SIZE
+    from .export import export_ndjson
+
+    report = CohortReport()
+    results = report.track(iter_plan_results(find_plan_files(args.paths), args.workers, args.chunk_size or CHUNK_SIZE))
+    if args.plans_out:
+        export_ndjson(args.plans_out, results)
+    else:
+        for _ in results:
+            pass
+    cohort = report.to_dict()
+    if args.json:
+        json.dump(cohort, sys.stdout, indent=2)
+        print()
+        return 0 if cohort['plans'] else 1
+
+    print(f"👥 {cohort['plans']} plans ({cohort['failed']} unreadable)")
+    print(f"📈 Tasks: {cohort['completed']}/{cohort['total_tasks']} ({cohort['completion_percentage']}%), "
+          f"mean per plan {cohort['mean_plan_completion']}%")
+    print(f"⏱️ Hours: {cohort['completed_hours']:.1f}/{cohort['total_hours']:.1f} ({cohort['hours_percentage']}%)")
+    print(f"⚠️ Behind schedule: {cohort['behind']} tasks in {cohort['plans_behind']} plans")
+    for label, count in cohort['completion_histogram'].items():
+        print(f"   {label:>7} {'█' * round(40 * count / max(cohort['plans'], 1))} {count}")
+    for plan in cohort['most_behind']:
+        print(f"🐢 {plan['behind']:>4} behind  {plan['path']}")
+    for category, stats in cohort['categories'].items():
+        print(f"🏷️ {category}: {stats['completed']}/{stats['total']}")
+    for error in cohort['errors']:
+        print(f"❌ {error['path']}: {error['error']}", file=sys.stderr)
+    if args.plans_out:
+        print(f"✅ Per-plan results written to {args.plans_out}")
+    return 0 if cohort['plans'] else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="tracker", description="Headless access to the career development tracker")
+    parser.add_argument("--plan-dir", default=".", help="directory holding the plan files (default: current directory)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    today = commands.add_parser("today", help="list today's tasks")
+    today.add_argument("--json", action="store_true", help="print task records as JSON")
+    today.set_defaults(handler=cmd_today)
+
+    complete = commands.add_parser("complete", help="mark a task as completed")
+    complete.add_argument("--id", type=int, required=True, help="task id")
+    complete.add_argument("--notes", default="", help="notes to store on the task")
+    complete.set_defaults(handler=cmd_complete)
+
+    summary = commands.add_parser("summary", help="show the progress summary")
+    summary.add_argument("--json", action="store_true", help="print the summary as JSON")
+    summary.set_defaults(handler=cmd_summary)
+
+    import_plan = commands.add_parser("import", help="replace the plan with a plan JSON or NDJSON file")
+    import_plan.add_argument("file")
+    import_plan.set_defaults(handler=cmd_import)
+
+    export = commands.add_parser("export", help="export to .json, .csv, .ndjson, .columns.json or .parquet")
+    export.add_argument("file")
+    export.add_argument("--quiet", action="store_true", help="do not show progress")
+    export.set_defaults(handler=cmd_export)
+
+    serve = commands.add_parser("serve", help="serve the local HTTP/JSON API")
+    serve.add_argument("--host", help="interface to listen on (default: localhost only)")
+    serve.add_argument("--port", type=int, help="port to listen on (default: 8765)")
+    serve.set_defaults(handler=cmd_serve)
+
+    rollup = commands.add_parser("rollup", help="summarize every plan in a workspace directory")
+    rollup.add_argument("workspace", nargs="?", default=WORKSPACE_DIR, help=f"one subdirectory per plan (default: {WORKSPACE_DIR})")
+    rollup.add_argument("--json", action="store_true", help="print the rollup as JSON")
+    rollup.set_defaults(standalone_handler=cmd_rollup)
+
+    cohort = commands.add_parser("cohort", help="summarize many plan files in parallel")
+    cohort.add_argument("paths", nargs="+", help=f"plan files, or directories searched for {SCHEDULE_FILE}")
+    cohort.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    cohort.add_argument("--chunk-size", type=int, help="plan files per worker task (default: 16)")
+    cohort.add_argument("--json", action="store_true", help="print the cohort report as JSON")
+    cohort.add_argument("--plans-out", help="also write one result per plan to this NDJSON file")
+    cohort.set_defaults(standalone_handler=cmd_cohort)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point"""
+    args = build_parser().parse_args(argv)
+    # Commands that work across plans do not open the current one
+    standalone_handler = getattr(args, "standalone_handler", None)
+    if standalone_handler is not None:
+        try:
+            return standalone_handler(args)
+        except (OSError, ValueError) as e:
+            print(f"❌ {args.command} failed: {e}", file=sys.stderr)
+            return 1
+
+    tracker = open_tracker(args.plan_dir)
+    try:
+        status = args.handler(tracker, args)
+    except (OSError, ValueError) as e:
+        print(f"❌ {args.command} failed: {e}", file=sys.stderr)
+        status = 1
+    finally:
+        # Journaled and pending changes must reach disk before the process exits
+        error = tracker.close()
+    if error is not None:
+        print(f"❌ Changes were not saved: {error}", file=sys.stderr)
+        return 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Cohort analytics over many plan files on a process pool
+Workers summarize plans straight from the files without opening a tracker, so nothing is written
+next to them; the parent folds each result into running totals as chunks finish
+"""
+
+import heapq
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import date
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .classifier import CategoryRules, CATEGORY_RULES_FILE, KeywordClassifier
+from .columns import TaskTable
+from .core import DEFAULT_DAYS, SCHEDULE_FILE
+from .journal import JOURNAL_FILE, PlanJournal
+from .workdays import WorkingDayCalendar, plan_day
+
+# Configuration
+CHUNK_SIZE = 16  # Plan files per worker task; larger chunks mean fewer round trips to the pool
+PENDING_CHUNKS_PER_WORKER = 2  # Chunks queued ahead per worker; bounds how many results wait in memory
+TOP_BEHIND = 10  # Plans listed in the report's most-behind table
+ERROR_SAMPLES = 20  # Failed files listed in the report
+SKIP_DIRS = {"backups", "__pycache__"}
+HISTOGRAM_LABELS = [f"{low}-{low + 9}%" for low in range(0, 100, 10)] + ["100%"]
+
+_classifier: Optional[KeywordClassifier] = None  # Per worker process, set by _init_worker
+
+
+def find_plan_files(paths: Iterable[str], name: str = SCHEDULE_FILE) -> Iterator[str]:
+    """Yield plan files: files given directly, and every file called name under the given directories"""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith("."))
+            if name in files:
+                yield os.path.join(root, name)
+
+
+# Workers
+
+def _init_worker(rules_file: str):
+    global _classifier
+    _classifier = CategoryRules(rules_file).classifier
+
+
+def analyze_plan(path: str, today: Optional[date] = None) -> Dict:
+    """Summarize one plan file, including changes still in a journal next to it"""
+    global _classifier
+    if _classifier is None:
+        _classifier = CategoryRules(CATEGORY_RULES_FILE).classifier
+
+    # Per-user plans are small and a worker holds one at a time, so the C parser beats streaming here
+    with open(path, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    if not isinstance(meta, dict):
+        raise ValueError("Plan file is not a JSON object")
+    records = meta.get("tasks", [])
+    if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+        raise ValueError("Plan tasks must be a list of objects")
+
+    journal = PlanJournal(os.path.join(os.path.dirname(path), JOURNAL_FILE))
+    if os.path.exists(journal.path):
+        by_id = {record["id"]: record for record in records}
+        # Read-only: the journal belongs to whoever has the plan open
+        for entry in journal.replay(meta.get("plan_id"), repair=False):
+            record = by_id.get(entry.get("id"))
+            if entry.get("op") == "update" and record is not None:
+                record.update(entry.get("fields", {}))
+
+    # Fill in what the tracker would on load
+    uncategorized = []
+    for record in records:
+        if not record.get("status"):
+            record["status"] = "completed" if record["done"] else "pending"
+        if not record.get("category"):
+            uncategorized.append(record)
+    for record, category in zip(uncategorized, _classifier.classify_many(record["title"] for record in uncategorized)):
+        record["category"] = category
+
+    table = TaskTable.from_records(records)
+    total_days = meta.get("total_days", DEFAULT_DAYS)
+    current_day = plan_day(meta.get("start_date"), total_days, WorkingDayCalendar(meta.get("skip_days", [5, 6])), today)
+    day, done = table.columns["day"], table.columns["done"]
+    behind = sum(1 for i in range(len(table)) if not done[i] and day[i] < current_day)
+    return dict(table.progress_summary(), path=path, start_date=meta.get("start_date"),
+                current_day=current_day, total_days=total_days, behind=behind)
+
+
+def analyze_plans(paths: List[str], today: Optional[date] = None) -> List[Dict]:
+    """Summarize a chunk of plan files; a file that cannot be read becomes an error result"""
+    results = []
+    for path in paths:
+        try:
+            results.append(analyze_plan(path, today))
+        except Exception as e:
+            # One bad file must not abort the whole cohort run
+            results.append({"path": path, "error": f"{type(e).__name__}: {e}"})
+    return results
+
+
+def iter_plan_results(paths: Iterable[str], workers: Optional[int] = None, chunk_size: int = CHUNK_SIZE,
+                      today: Optional[date] = None) -> Iterator[Dict]:
+    """Analyze plan files on a process pool, yielding per-plan results in completion order"""
+    workers = workers or os.cpu_count() or 1
+    paths = iter(paths)
+    rules_file = os.path.abspath(CATEGORY_RULES_FILE)
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(rules_file,)) as pool:
+        pending = set()
+        while True:
+            # Only a few chunks are in flight; later paths are not even listed yet
+            while len(pending) < workers * PENDING_CHUNKS_PER_WORKER:
+                chunk = list(islice(paths, chunk_size))
+                if not chunk:
+                    break
+                pending.add(pool.submit(analyze_plans, chunk, today))
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+# Merging
+
+class CohortReport:
+    """Running cohort totals; per-plan results are folded in and then dropped"""
+
+    def __init__(self, top: int = TOP_BEHIND):
+        self.top = top
+        self.plans = 0
+        self.failed = 0
+        self.errors: List[Dict] = []
+        self.total_tasks = 0
+        self.completed = 0
+        self.in_progress = 0
+        self.total_hours = 0.0
+        self.completed_hours = 0.0
+        self.behind = 0
+        self.plans_behind = 0
+        self.completion_sum = 0.0
+        self.histogram = [0] * len(HISTOGRAM_LABELS)  # Plans per completion decile; the last bucket is 100%
+        self.categories: Dict[str, Dict] = {}
+        self._most_behind: List = []  # Min-heap of (behind, path)
+
+    def add(self, result: Dict):
+        """Fold one plan's result into the totals"""
+        if "error" in result:
+            self.failed += 1
+            if len(self.errors) < ERROR_SAMPLES:
+                self.errors.append(result)
+            return
+
+        self.plans += 1
+        self.total_tasks += result["total_tasks"]
+        self.completed += result["completed"]
+        self.in_progress += result["in_progress"]
+        self.total_hours += result["total_hours"]
+        self.completed_hours += result["completed_hours"]
+        self.completion_sum += result["completion_percentage"]
+        # The percentage is rounded, so only a plan with every task completed counts as 100%
+        finished = result["total_tasks"] > 0 and result["completed"] == result["total_tasks"]
+        self.histogram[10 if finished else min(int(result["completion_percentage"] // 10), 9)] += 1
+        for category, stats in result["categories"].items():
+            merged = self.categories.setdefault(category, {"total": 0, "completed": 0, "hours": 0.0, "completed_hours": 0.0})
+            for key in merged:
+                merged[key] += stats[key]
+
+        if result["behind"]:
+            self.behind += result["behind"]
+            self.plans_behind += 1
+            entry = (result["behind"], result["path"])
+            if len(self._most_behind) < self.top:
+                heapq.heappush(self._most_behind, entry)
+            elif entry > self._most_behind[0]:
+                heapq.heapreplace(self._most_behind, entry)
+
+    def track(self, results: Iterable[Dict]) -> Iterator[Dict]:
+        """Fold results in while passing them through, e.g. to an NDJSON writer"""
+        for result in results:
+            self.add(result)
+            yield result
+
+    def to_dict(self) -> Dict:
+        """Get the cohort report"""
+        return {
+            "plans": self.plans,
+            "failed": self.failed,
+            "total_tasks": self.total_tasks,
+            "completed": self.completed,
+            "in_progress": self.in_progress,
+            "completion_percentage": round((self.completed / self.total_tasks) * 100, 1) if self.total_tasks > 0 else 0,
+            "mean_plan_completion": round(self.completion_sum / self.plans, 1) if self.plans else 0,
+            "total_hours": self.total_hours,
+            "completed_hours": self.completed_hours,
+            "hours_percentage": round((self.completed_hours / self.total_hours) * 100, 1) if self.total_hours > 0 else 0,
+            "behind": self.behind,
+            "plans_behind": self.plans_behind,
+            "completion_histogram": dict(zip(HISTOGRAM_LABELS, self.histogram)),
+            "most_behind": [{"path": path, "behind": behind} for behind, path in sorted(self._most_behind, reverse=True)],
+            "categories": self.categories,
+            "errors": self.errors
+        }
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Columnar task table for aggregates
+Numeric task fields live in contiguous typed columns so aggregates run over whole columns
+"""
+
+from array import array
+from typing import Dict, Iterable, List
+
+from .aggregate import progress_report, progress_summary
+from .snapshot import STATUS_INDEX
+
+# Column name and array typecode
+COLUMNS = [("id", "q"), ("hours", "d"), ("day", "i"), ("category", "I"), ("status", "B"), ("done", "B")]
+
+
+class TaskTable:
+    """Typed columns for id, hours, day, category code, status code and done flag"""
+
+    def __init__(self, columns: Dict, categories: List[str]):
+        self.columns = columns
+        self.categories = categories
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> 'TaskTable':
+        """Build an in-memory table from plain task records"""
+        columns = {name: array(typecode) for name, typecode in COLUMNS}
+        categories: List[str] = []
+        category_codes: Dict[str, int] = {}
+        for record in records:
+            category = record.get("category") or ""
+            code = category_codes.get(category)
+            if code is None:
+                code = category_codes[category] = len(categories)
+                categories.append(category)
+            columns["id"].append(record["id"])
+            columns["hours"].append(float(record["hours"]))
+            columns["day"].append(record["day"])
+            columns["category"].append(code)
+            columns["status"].append(STATUS_INDEX[record["status"]])
+            columns["done"].append(1 if record["done"] else 0)
+        return cls(columns, categories)
+
+    @classmethod
+    def from_tasks(cls, tasks: List) -> 'TaskTable':
+        """Build an in-memory table from task objects, filling one column at a time"""
+        categories: List[str] = []
+        category_codes: Dict[str, int] = {}
+        for task in tasks:
+            if task.category not in category_codes:
+                category_codes[task.category] = len(categories)
+                categories.append(task.category)
+
+        columns = {
+            "id": array("q", [task.id for task in tasks]),
+            "hours": array("d", [float(task.hours) for task in tasks]),
+            "day": array("i", [task.day for task in tasks]),
+            "category": array("I", [category_codes[task.category] for task in tasks]),
+            "status": array("B", [STATUS_INDEX[task.status.value] for task in tasks]),
+            "done": array("B", [1 if task.done else 0 for task in tasks])
+        }
+        return cls(columns, categories)
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def progress_summary(self) -> Dict:
+        """Compute the tracker's progress summary with whole-column operations"""
+        return progress_summary(self.columns, self.categories)
+
+    def progress_report(self) -> Dict:
+        """Get the progress summary plus per-status, per-day and per-week breakdowns"""
+        return progress_report(self.columns, self.categories)
@@ -0,0 +1,876 @@
+#!/usr/bin/env python3
+"""
+Tracker core: the task model and EnhancedCybersecurityTracker
+Has no GUI imports, so scripts and the command-line interface can use it without Tk or a display
+"""
+
+import json
+import os
+import shutil
+import sys
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, asdict
+from enum import Enum
+from .journal import PlanJournal, JOURNAL_FILE
+from .store import PlanStore, SQLitePlanStore, DB_FILE, migrate_json_to_store
+from .workdays import WorkingDayCalendar, plan_day
+from .search import TaskSearchIndex
+from .writer import BackgroundWriter, SAVE_DELAY
+from .backups import BackupStore
+from .json_stream import read_plan, write_plan
+from .snapshot import SnapshotReader, write_snapshot, SNAPSHOT_FILE
+from .columns import TaskTable
+from .classifier import CategoryRules, CATEGORY_RULES_FILE, KeywordClassifier, titles_with_keywords
+
+# Configuration
+STATE_FILE = "enhanced_plan_state.json"
+SCHEDULE_FILE = "my_schedule.json"  # Kept in sync with STATE_FILE on every save
+BACKUP_DIR = "backups"
+DEFAULT_DAYS = 42
+# Plan files checked at startup, highest priority first
+PLAN_SOURCES = [
+    SCHEDULE_FILE,  # Your personal file (gitignored)
+    "my_plan_data.json",
+    "personal_plan.json",
+    "user_data.json",
+    "plan_data.json",
+    STATE_FILE
+]
+USE_JOURNAL = True  # Append task changes to a journal instead of rewriting the state file
+STORE_BACKEND = "json"  # "json" for the state files, "sqlite" for DB_FILE
+DEBUG_SUMMARY_CHECK = False  # Verify the running progress counters against a full recompute
+COMPACT_STATE_FILE = False  # Write the state files without indentation
+USE_BINARY_SNAPSHOT = False  # Save to SNAPSHOT_FILE instead of the JSON state files
+SLOTTED_TASKS = True  # Build tasks as CompactTask, which has no per-instance __dict__
+
+class TaskStatus(Enum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    SKIPPED = "skipped"
+
+STATUS_EMOJI = {
+    TaskStatus.PENDING: "⏳",
+    TaskStatus.IN_PROGRESS: "🔄",
+    TaskStatus.COMPLETED: "✅",
+    TaskStatus.SKIPPED: "⏭️"
+}
+
+@dataclass
+class Task:
+    id: int
+    title: str
+    hours: float
+    day: int
+    done: bool
+    created_order: int
+    status: TaskStatus = TaskStatus.PENDING
+    notes: str = ""
+    completed_date: Optional[str] = None
+    category: str = ""
+
+# Status codes are positions in this tuple, matching the snapshot and column files
+STATUS_BY_CODE = tuple(TaskStatus)
+STATUS_CODE = {status: code for code, status in enumerate(STATUS_BY_CODE)}
+
+@dataclass(init=False)
+class CompactTask:
+    """Task with __slots__, an interned category and the status kept as a small int code"""
+    __slots__ = ("id", "title", "hours", "day", "done", "created_order", "_status_code", "notes", "completed_date", "_category")
+    id: int
+    title: str
+    hours: float
+    day: int
+    done: bool
+    created_order: int
+    status: TaskStatus
+    notes: str
+    completed_date: Optional[str]
+    category: str
+    
+    def __init__(self, id: int, title: str, hours: float, day: int, done: bool, created_order: int,
+                 status: TaskStatus = TaskStatus.PENDING, notes: str = "", completed_date: Optional[str] = None,
+                 category: str = ""):
+        self.id = id
+        self.title = title
+        self.hours = hours
+        self.day = day
+        self.done = done
+        self.created_order = created_order
+        self.status = status
+        self.notes = notes
+        self.completed_date = completed_date
+        self.category = category
+    
+    @property
+    def status(self) -> TaskStatus:
+        return STATUS_BY_CODE[self._status_code]
+    
+    @status.setter
+    def status(self, status: TaskStatus):
+        self._status_code = STATUS_CODE[status]
+    
+    @property
+    def category(self) -> str:
+        return self._category
+    
+    @category.setter
+    def category(self, category: str):
+        # A plan has a handful of categories shared by every task
+        self._category = sys.intern(category)
+
+class EnhancedCybersecurityTracker:
+    def __init__(self, use_journal: bool = USE_JOURNAL, store: Optional[PlanStore] = None, plan_dir: str = "."):
+        # Every plan file lives in plan_dir, so several plans can be open in one process
+        self.plan_dir = plan_dir
+        self.state_file = self.plan_path(STATE_FILE)
+        self.schedule_file = self.plan_path(SCHEDULE_FILE)
+        self.backup_dir = self.plan_path(BACKUP_DIR)
+        if store is None and STORE_BACKEND == "sqlite":
+            store = SQLitePlanStore(self.plan_path(DB_FILE))
+        self.store = store
+        # A store persists single-task updates itself, so the journal is only used for JSON
+        self.journal = PlanJournal(self.plan_path(JOURNAL_FILE)) if use_journal and store is None else None
+        self.writer = None  # Set by enable_background_saves
+        self.compact_state = COMPACT_STATE_FILE
+        self.snapshot_file = self.plan_path(SNAPSHOT_FILE)
+        self.binary_snapshot = USE_BINARY_SNAPSHOT
+        self.task_class = CompactTask if SLOTTED_TASKS else Task
+        self.category_rules = CategoryRules(CATEGORY_RULES_FILE)
+        self.ensure_backup_dir()
+        self.backups = BackupStore(self.backup_dir)
+        legacy_backups = self.backups.import_legacy_backups()
+        if legacy_backups:
+            print(f"📦 Moved {legacy_backups} old backup files into {self.backup_dir}")
+        
+        # Initialize state
+        self.start_date = None
+        self.end_date = None
+        self.total_days = DEFAULT_DAYS
+        self.hours_per_day_target = 6.0
+        self.skip_days = [5, 6]  # Default to skipping weekends (Saturday=5, Sunday=6)
+        self.tasks = []
+        self.version = 2
+        self.plan_id = None  # Identifies the plan the journal was written on top of; assigned on save
+        
+        # Secondary indexes over self.tasks, kept in sync by every mutation
+        self._tasks_by_id: Dict[int, Task] = {}
+        self._tasks_by_day: Dict[int, Dict[int, Task]] = {}
+        self._tasks_by_category: Dict[str, Dict[int, Task]] = {}
+        self._tasks_by_status: Dict[TaskStatus, Dict[int, Task]] = {}
+        
+        # Running progress counters, adjusted by _count_task as tasks change
+        self._total_hours = 0.0
+        self._completed_hours = 0.0
+        self._category_stats: Dict[str, Dict] = {}
+        
+        self._calendar = None
+        self._search_index = None  # Built on first search
+        
+        # Load existing data or create from template
+        # Always try to load from user data first, then fall back to state file
+        if self.store is not None:
+            self.load_from_store()
+        else:
+            self.load_from_template_or_data()
+    
+    def plan_path(self, name: str) -> str:
+        """Get the path of one of this plan's files"""
+        return name if self.plan_dir == "." else os.path.join(self.plan_dir, name)
+    
+    def ensure_backup_dir(self):
+        """Create backup directory if it doesn't exist"""
+        if not os.path.exists(self.backup_dir):
+            os.makedirs(self.backup_dir)
+    
+    def find_plan_sources(self) -> List[str]:
+        """Get the plan files present in the plan directory, in load priority order"""
+        # One directory listing instead of an existence check per candidate
+        present = set(os.listdir(self.plan_dir))
+        return [self.plan_path(name) for name in PLAN_SOURCES if name in present]
+    
+    def load_from_template_or_data(self):
+        """Load plan from user data or create from template"""
+        sources = self.find_plan_sources()
+        if self.binary_snapshot and self.load_snapshot(sources):
+            return True
+        
+        # A snapshot newer than every JSON file holds changes made while snapshot mode was on
+        if not self.binary_snapshot and self.load_snapshot(sources, strictly_newer=True):
+            print(f"🔄 {self.snapshot_file} is newer than the JSON plan files; bringing them up to date")
+            self.save_state()
+            return True
+        
+        # Try to load user's personal plan first
+        for data_file in sources:
+            try:
+                with open(data_file, 'r', encoding='utf-8') as f:
+                    changed = self._apply_plan_data(*read_plan(f))
+                # Apply journaled changes; they stay in the journal until the next compaction
+                self._replay_journal()
+                
+                # Only rewrite the state files when they would differ from what was loaded
+                if changed or data_file not in (self.state_file, self.schedule_file):
+                    self.save_state()
+                print(f"✅ Loaded {len(self.tasks)} tasks from {data_file}!")
+                print(f"📊 Categories found: {set(self._tasks_by_category)}")
+                print(f"📅 Current day: {self.get_current_day()}")
+                return True
+                
+            except Exception as e:
+                print(f"❌ Error loading {data_file}: {e}")
+                continue
+        
+        # If no user data found, create from template
+        print("📝 No personal plan found. Creating from template...")
+        self.create_from_template()
+        return True
+    
+    def load_snapshot(self, json_sources: List[str], strictly_newer: bool = False) -> bool:
+        """Load the binary snapshot unless a JSON plan file has been changed since it was written"""
+        if not os.path.exists(self.snapshot_file):
+            return False
+        snapshot_mtime = os.path.getmtime(self.snapshot_file)
+        newest_source = max((os.path.getmtime(source) for source in json_sources), default=None)
+        if newest_source is not None:
+            # With strictly_newer, a JSON file written in the same clock tick as the snapshot wins
+            if newest_source > snapshot_mtime or (strictly_newer and newest_source == snapshot_mtime):
+                return False
+        
+        try:
+            with SnapshotReader(self.snapshot_file) as reader:
+                self._apply_plan_data(reader.meta, reader)
+            self._replay_journal()
+            print(f"✅ Loaded {len(self.tasks)} tasks from {self.snapshot_file}!")
+            return True
+        except Exception as e:
+            print(f"❌ Error loading {self.snapshot_file}: {e}")
+            return False
+    
+    def _apply_plan_data(self, meta: Dict, task_records) -> bool:
+        """Replace the plan with parsed plan data; returns True if defaults had to be filled in"""
+        # Convert tasks to our format in a single pass (this also completes a streamed meta)
+        changed = False
+        tasks = []
+        for task_data in task_records:
+            if "status" not in task_data or "category" not in task_data:
+                changed = True
+            tasks.append(self._task_from_record(task_data, categorize=False))
+        self._categorize_tasks(tasks)
+        
+        changed = changed or "start_date" not in meta or "end_date" not in meta or "plan_id" not in meta
+        self.start_date = meta.get("start_date", datetime.now().strftime("%Y-%m-%d"))
+        self.end_date = meta.get("end_date", (datetime.now() + timedelta(days=41)).strftime("%Y-%m-%d"))
+        self.total_days = meta.get("total_days", DEFAULT_DAYS)
+        self.hours_per_day_target = meta.get("hours_per_day_target", 6.0)
+        self.skip_days = meta.get("skip_days", [5, 6])  # Default to weekends
+        self.version = meta.get("version", 2)
+        self.plan_id = meta.get("plan_id")
+        
+        self.tasks = tasks
+        self._rebuild_indexes()
+        return self._apply_saved_category_rules(meta.get("category_rules")) or changed
+    
+    def _task_from_record(self, task_data: Dict, categorize: bool = True) -> Task:
+        """Build a task from a stored record, filling in status and category (unless categorize=False) when missing"""
+        status = task_data.get("status")
+        return self.task_class(
+            id=task_data["id"],
+            title=task_data["title"],
+            hours=float(task_data["hours"]),
+            day=task_data["day"],
+            done=task_data["done"],
+            created_order=task_data["created_order"],
+            status=TaskStatus(status) if status else (TaskStatus.COMPLETED if task_data["done"] else TaskStatus.PENDING),
+            notes=task_data.get("notes") or "",
+            completed_date=task_data.get("completed_date"),
+            # Only categorize when the record has no category; the keyword scan is not free
+            category=task_data.get("category") or (self._categorize_task(task_data["title"]) if categorize else "")
+        )
+    
+    def _categorize_task(self, title: str) -> str:
+        """Automatically categorize tasks based on title keywords"""
+        return self.category_rules.classifier.classify(title)
+    
+    def _categorize_tasks(self, tasks: List[Task]):
+        """Fill in the category of every uncategorized task with one classifier pass"""
+        uncategorized = [task for task in tasks if not task.category]
+        categories = self.category_rules.classifier.classify_many(task.title for task in uncategorized)
+        for task, category in zip(uncategorized, categories):
+            task.category = category
+    
+    def reload_category_rules(self) -> int:
+        """Re-apply the category rules file if it changed; returns the number of tasks re-categorized"""
+        old_classifier = self.category_rules.classifier
+        if not self.category_rules.reload_if_changed():
+            return 0
+        
+        new_classifier = self.category_rules.classifier
+        changed = self._recategorize(old_classifier, new_classifier)
+        # The rules are saved with the plan, so save even if no task moved
+        if new_classifier.to_dict() != old_classifier.to_dict():
+            self.save_state()
+        if changed:
+            print(f"🏷️ Category rules reloaded: {changed} tasks re-categorized")
+        return changed
+    
+    def _apply_saved_category_rules(self, saved_rules: Optional[Dict]) -> bool:
+        """Re-apply the current rules if they differ from the ones saved with the plan; returns True if the plan needs saving"""
+        current = self.category_rules.classifier
+        if saved_rules == current.to_dict():
+            return False
+        
+        # Plans saved before the rules were recorded have nothing to compare against
+        if saved_rules is not None:
+            try:
+                old_classifier = KeywordClassifier.from_dict(saved_rules)
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"❌ Ignoring the category rules saved with the plan: {e}")
+                return True
+            changed = self._recategorize(old_classifier, current)
+            if changed:
+                print(f"🏷️ Category rules changed since the last save: {changed} tasks re-categorized")
+        return True
+    
+    def _recategorize(self, old_classifier: KeywordClassifier, new_classifier: KeywordClassifier) -> int:
+        """Move tasks the old rules categorized to the category the new rules give them; returns how many moved"""
+        # Only titles containing a keyword that changed can be categorized differently, so the
+        # others are never classified again
+        affected = titles_with_keywords((task.title for task in self.tasks), new_classifier.changed_keywords(old_classifier))
+        tasks = [task for task in self.tasks if task.title in affected]
+        if new_classifier.default != old_classifier.default:
+            # Titles with no keyword at all follow the default
+            tasks.extend(task for task in self.get_tasks_by_category(old_classifier.default) if task.title not in affected)
+        
+        # A task is only moved if the old rules gave it its current category (so it was
+        # not categorized by hand or by the plan file) and the new rules disagree
+        titles = [task.title for task in tasks]
+        old_categories = old_classifier.classify_many(titles)
+        new_categories = new_classifier.classify_many(titles)
+        changed = 0
+        for task, old_category, new_category in zip(tasks, old_categories, new_categories):
+            if old_category != new_category and task.category == old_category:
+                self._set_task_category(task, new_category)
+                changed += 1
+        return changed
+    
+    def get_behind_schedule_tasks(self) -> List['Task']:
+        """Get tasks that should have been completed by now based on current day"""
+        current_day = self.get_current_day()
+        behind_tasks = []
+        
+        for day, day_tasks in self._tasks_by_day.items():
+            # If task is for a day that has already passed and not completed
+            if day < current_day:
+                behind_tasks.extend(task for task in day_tasks.values() if not task.done)
+        
+        return behind_tasks
+    
+    def create_from_template(self):
+        """Create a plan from the template"""
+        template_path = "sample_schedule_template.json"
+        
+        if os.path.exists(template_path):
+            try:
+                with open(template_path, 'r', encoding='utf-8') as f:
+                    template = json.load(f)
+                
+                plan_info = template.get("plan_info", {})
+                self.plan_id = uuid.uuid4().hex
+                self.start_date = datetime.now().strftime("%Y-%m-%d")
+                self.total_days = plan_info.get("total_days", DEFAULT_DAYS)
+                self.end_date = (datetime.now() + timedelta(days=self.total_days-1)).strftime("%Y-%m-%d")
+                self.hours_per_day_target = plan_info.get("hours_per_day_target", 6.0)
+                
+                # Create tasks from template
+                self.tasks = []
+                task_id = 100
+                for task_data in template.get("sample_tasks", []):
+                    task = self.task_class(
+                        id=task_id,
+                        title=task_data["title"],
+                        hours=float(task_data["hours"]),
+                        day=task_data["day"],
+                        done=task_data["done"],
+                        created_order=task_id,
+                        status=TaskStatus.PENDING,
+                        category=task_data.get("category", "")
+                    )
+                    self.tasks.append(task)
+                    task_id += 1
+                self._categorize_tasks(self.tasks)
+                
+                self._rebuild_indexes()
+                self.save_state()
+                print(f"✅ Created plan from template with {len(self.tasks)} sample tasks!")
+                print("💡 Tip: Use the AI prompt template to generate your custom plan!")
+                
+            except Exception as e:
+                print(f"❌ Error loading template: {e}")
+                self.create_default_plan()
+        else:
+            self.create_default_plan()
+    
+    def create_default_plan(self):
+        """Create a basic plan if no data is available"""
+        self.plan_id = uuid.uuid4().hex
+        self.start_date = datetime.now().strftime("%Y-%m-%d")
+        self.total_days = DEFAULT_DAYS
+        self.end_date = (datetime.now() + timedelta(days=self.total_days-1)).strftime("%Y-%m-%d")
+        self.tasks = []
+        self._rebuild_indexes()
+        self.save_state()
+    
+    def load_state(self) -> bool:
+        """Load state from file"""
+        if not os.path.exists(self.state_file):
+            return False
+        
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                self._apply_plan_data(*read_plan(f))
+            self._replay_journal()
+            return True
+        except Exception as e:
+            print(f"Error loading state: {e}")
+            return False
+    
+    def import_plan(self, file_path: str) -> int:
+        """Replace the plan with one read from a plan JSON or NDJSON export; returns the number of tasks"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            if file_path.endswith(".ndjson"):
+                # NDJSON exports hold only tasks, so the current plan dates are kept
+                records = (json.loads(line) for line in f if line.strip())
+                self._apply_plan_data(self._plan_meta(), records)
+            else:
+                self._apply_plan_data(*read_plan(f))
+        # The full save also clears journaled changes that belonged to the old plan
+        self.save_state()
+        return len(self.tasks)
+    
+    def load_from_store(self):
+        """Load plan from the configured store, migrating the JSON plan files or the template into it if it is empty"""
+        meta, records = self.store.load()
+        if not meta and not records:
+            if migrate_json_to_store(self.store, self.find_plan_sources(), self.plan_path(JOURNAL_FILE)) is None:
+                self.create_from_template()
+                return
+            meta, records = self.store.load()
+        
+        self.start_date = meta.get("start_date")
+        self.end_date = meta.get("end_date")
+        self.total_days = meta.get("total_days", DEFAULT_DAYS)
+        self.hours_per_day_target = meta.get("hours_per_day_target", 6.0)
+        self.skip_days = meta.get("skip_days", [5, 6])
+        self.version = meta.get("version", 2)
+        self.plan_id = meta.get("plan_id")
+        
+        self.tasks = [self._task_from_record(task_data, categorize=False) for task_data in records]
+        self._categorize_tasks(self.tasks)
+        self._rebuild_indexes()
+        if self._apply_saved_category_rules(meta.get("category_rules")):
+            self.save_state()
+    
+    def _task_record(self, task: Task) -> Dict:
+        """Convert a task to the plain dict stored on disk"""
+        return {
+            "id": task.id,
+            "title": task.title,
+            "hours": task.hours,
+            "day": task.day,
+            "done": task.done,
+            "created_order": task.created_order,
+            "status": task.status.value,
+            "notes": task.notes,
+            "completed_date": task.completed_date,
+            "category": task.category
+        }
+    
+    def get_task_records(self, tasks: List[Task]) -> List[Dict]:
+        """Get the plain records of the given tasks"""
+        return [self._task_record(task) for task in tasks]
+    
+    def iter_task_records(self):
+        """Lazily yield the plain record of every task, in plan order"""
+        # Iterate over a copy of the list so tasks added meanwhile cannot break the loop
+        return (self._task_record(task) for task in list(self.tasks))
+    
+    def enable_background_saves(self, delay: float = SAVE_DELAY):
+        """Move JSON state writes onto a background thread that coalesces bursts of saves"""
+        if self.writer is None and self.store is None:
+            self.writer = BackgroundWriter(self._write_state, delay)
+    
+    def close(self) -> Optional[Exception]:
+        """Flush pending writes and release files and connections; returns the error if the final save failed"""
+        error = None
+        if self.writer is not None:
+            error = self.writer.stop()
+            self.writer = None
+        if self.journal is not None:
+            # Fold the journal into the state files so nothing is left to replay on the next start
+            if error is None and self.journal.record_count:
+                try:
+                    self._write_state()
+                except Exception as e:
+                    error = e
+            self.journal.close()
+        if self.store is not None:
+            self.store.close()
+        return error
+    
+    def save_state(self):
+        """Save current state to file with backup"""
+        if self.writer is not None:
+            self.writer.request()
+            return
+        self._write_state()
+    
+    def _write_state(self):
+        """Write the full state, atomically replacing the state files"""
+        if self.plan_id is None:
+            self.plan_id = uuid.uuid4().hex
+        if self.store is not None:
+            self.store.save(self._plan_meta(), list(self.iter_task_records()))
+            return
+        
+        # Records appended after this point are not guaranteed to be in the snapshot
+        journal_count = self.journal.record_count if self.journal is not None else None
+        if self.journal is not None:
+            # A journal started after this save belongs on top of it
+            self.journal.base = self.plan_id
+        
+        if self.binary_snapshot:
+            snapshot_tmp = f"{self.snapshot_file}.tmp"
+            write_snapshot(snapshot_tmp, self._plan_meta(), self.iter_task_records())
+            self.backup_replaced_files(self.snapshot_file)
+            os.replace(snapshot_tmp, self.snapshot_file)
+            self.backups.backup_file(self.snapshot_file)
+            if self.journal is not None:
+                self.journal.truncate(journal_count)
+            return
+        
+        # Save current state, streaming one task at a time to the temp file.
+        # Tasks are only read here; a change made mid-snapshot requests another save
+        state_tmp = f"{self.state_file}.tmp"
+        with open(state_tmp, 'w', encoding='utf-8') as f:
+            write_plan(f, self._plan_meta(), self.iter_task_records(), compact=self.compact_state)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        # Also save to my_schedule.json to preserve progress
+        schedule_tmp = f"{self.schedule_file}.tmp"
+        shutil.copyfile(state_tmp, schedule_tmp)
+        
+        # Save to both state file AND my_schedule.json to keep them in sync
+        self.backup_replaced_files(self.state_file, self.schedule_file)
+        os.replace(state_tmp, self.state_file)
+        os.replace(schedule_tmp, self.schedule_file)
+        
+        # Create backup (skipped when the content has not changed since the last one)
+        self.backups.backup_file(self.state_file)
+        
+        # Everything in the journal is now part of the snapshot
+        if self.journal is not None:
+            self.journal.truncate(journal_count)
+    
+    def backup_replaced_files(self, *paths: str):
+        """Back up files about to be overwritten, e.g. a state file that was not the one loaded"""
+        for path in paths:
+            # Skipped when the content matches the last backup, as it does after a normal save
+            if os.path.exists(path):
+                self.backups.backup_file(path)
+    
+    def _plan_meta(self) -> Dict:
+        """Get the plan-level fields that are saved alongside the tasks"""
+        return {
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "total_days": self.total_days,
+            "hours_per_day_target": self.hours_per_day_target,
+            "skip_days": self.skip_days,
+            "version": self.version,
+            "plan_id": self.plan_id,
+            # The rules the categories were filled in with, so a rules change made while closed is applied on load
+            "category_rules": self.category_rules.classifier.to_dict()
+        }
+    
+    def get_export_meta(self) -> Dict:
+        """Get the plan-level fields written at the top of a JSON export"""
+        meta = dict(self._plan_meta(), export_date=datetime.now().isoformat())
+        # An exported copy that is loaded or dropped in later is a new plan to the journal
+        del meta["plan_id"]
+        return meta
+    
+    def _replay_journal(self):
+        """Apply journaled task changes on top of the loaded snapshot"""
+        if self.journal is None:
+            return
+        
+        for record in self.journal.replay(self.plan_id):
+            task = self._tasks_by_id.get(record.get("id"))
+            if record.get("op") != "update" or task is None:
+                continue
+            fields = dict(record.get("fields", {}))
+            status = TaskStatus(fields.pop("status", task.status.value))
+            self._set_task_state(task, status, fields.pop("done", task.done))
+            for field, value in fields.items():
+                setattr(task, field, value)
+    
+    def _rebuild_indexes(self):
+        """Rebuild the id, day, category and status indexes from self.tasks"""
+        self._tasks_by_id = {}
+        self._tasks_by_day = {}
+        self._tasks_by_category = {}
+        self._tasks_by_status = {}
+        self._total_hours = 0.0
+        self._completed_hours = 0.0
+        self._category_stats = {}
+        self._search_index = None
+        for task in self.tasks:
+            self._tasks_by_id[task.id] = task
+            self._tasks_by_day.setdefault(task.day, {})[task.id] = task
+            self._tasks_by_category.setdefault(task.category, {})[task.id] = task
+            self._tasks_by_status.setdefault(task.status, {})[task.id] = task
+            self._count_task(task, 1)
+    
+    def _count_task(self, task: Task, sign: int):
+        """Add (sign=1) or remove (sign=-1) a task's contribution to the progress counters"""
+        hours = sign * task.hours
+        self._total_hours += hours
+        
+        cat = task.category
+        if cat not in self._category_stats:
+            self._category_stats[cat] = {"total": 0, "completed": 0, "hours": 0.0, "completed_hours": 0.0}
+        stats = self._category_stats[cat]
+        stats["total"] += sign
+        stats["hours"] += hours
+        if task.done:
+            self._completed_hours += hours
+            stats["completed"] += sign
+            stats["completed_hours"] += hours
+        if stats["total"] == 0:
+            del self._category_stats[cat]
+    
+    def _set_task_state(self, task: Task, status: TaskStatus, done: bool):
+        """Change a task's status and done flag, keeping the indexes and counters in sync"""
+        self._count_task(task, -1)
+        if status != task.status:
+            del self._tasks_by_status[task.status][task.id]
+            self._tasks_by_status.setdefault(status, {})[task.id] = task
+            task.status = status
+        task.done = done
+        self._count_task(task, 1)
+    
+    def _set_task_category(self, task: Task, category: str):
+        """Move a task to another category, keeping the indexes and counters in sync"""
+        self._count_task(task, -1)
+        bucket = self._tasks_by_category[task.category]
+        del bucket[task.id]
+        if not bucket:
+            del self._tasks_by_category[task.category]
+        task.category = category
+        self._tasks_by_category.setdefault(category, {})[task.id] = task
+        self._count_task(task, 1)
+    
+    def _commit_task_change(self, task: Task):
+        """Persist a single task change, compacting the journal when it grows too long"""
+        if self.store is not None:
+            self.store.update_task(self._task_record(task))
+            return
+        if self.journal is None:
+            self.save_state()
+            return
+        
+        self.journal.append("update", task.id, {
+            "done": task.done,
+            "status": task.status.value,
+            "notes": task.notes,
+            "completed_date": task.completed_date
+        })
+        if self.journal.needs_compaction():
+            self.save_state()
+    
+    def get_current_day(self) -> int:
+        """Calculate current day based on start date, skipping selected days"""
+        return plan_day(self.start_date, self.total_days, self.get_calendar())
+    
+    def get_calendar(self) -> WorkingDayCalendar:
+        """Get the working-day calendar for the current skip days"""
+        if self._calendar is None or self._calendar.skip_days != tuple(sorted(set(self.skip_days))):
+            self._calendar = WorkingDayCalendar(self.skip_days)
+        return self._calendar
+    
+    def get_working_days_between(self, start_date, end_date) -> int:
+        """Calculate working days between two dates (excluding selected skip days)"""
+        return self.get_calendar().working_days_between(start_date, end_date)
+    
+    def get_working_day_date(self, working_day: int) -> datetime:
+        """Get the actual date for a given working day number"""
+        if not self.start_date:
+            return datetime.now()
+        
+        start = datetime.strptime(self.start_date, "%Y-%m-%d")
+        return self.get_calendar().working_day_date(start, working_day)
+    
+    def get_working_day_dates(self, working_days: List[int]) -> List[datetime]:
+        """Get the actual dates for many working day numbers at once"""
+        if not self.start_date:
+            return [datetime.now() for _ in working_days]
+        
+        start = datetime.strptime(self.start_date, "%Y-%m-%d")
+        return self.get_calendar().working_day_dates(start, working_days)
+    
+    def update_skip_days(self, skip_days: list):
+        """Update which days to skip"""
+        self.skip_days = skip_days
+        self.save_state()
+    
+    def get_day_name(self, weekday: int) -> str:
+        """Get day name from weekday number (0=Monday, 6=Sunday)"""
+        days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+        return days[weekday]
+    
+    def get_skip_days_names(self) -> list:
+        """Get list of day names that are being skipped"""
+        return [self.get_day_name(day) for day in self.skip_days]
+    
+    def get_task(self, task_id: int) -> Optional[Task]:
+        """Get a task by id"""
+        return self._tasks_by_id.get(task_id)
+    
+    def get_today_tasks(self) -> List[Task]:
+        """Get all tasks for today"""
+        current_day = self.get_current_day()
+        return list(self._tasks_by_day.get(current_day, {}).values())
+    
+    def get_week_tasks(self, week: int) -> List[Task]:
+        """Get all tasks for a specific week"""
+        start_day = (week - 1) * 7 + 1
+        end_day = min(week * 7, self.total_days)
+        week_tasks = []
+        for day in range(start_day, end_day + 1):
+            week_tasks.extend(self._tasks_by_day.get(day, {}).values())
+        return week_tasks
+    
+    def get_tasks_by_category(self, category: str) -> List[Task]:
+        """Get tasks by category"""
+        return list(self._tasks_by_category.get(category, {}).values())
+    
+    def get_tasks_by_status(self, status: TaskStatus) -> List[Task]:
+        """Get tasks by status"""
+        return list(self._tasks_by_status.get(status, {}).values())
+    
+    def search_task_ids(self, query: str) -> set:
+        """Get ids of tasks whose title or notes contain the query (case-insensitive)"""
+        if self._search_index is None:
+            self._search_index = TaskSearchIndex(self.tasks)
+        return self._search_index.search(query)
+    
+    def mark_task_complete(self, task_id: int, notes: str = ""):
+        """Mark a task as completed"""
+        task = self._tasks_by_id.get(task_id)
+        if task is None:
+            return False
+        
+        self._set_task_state(task, TaskStatus.COMPLETED, True)
+        task.notes = notes
+        if self._search_index is not None:
+            self._search_index.update(task)
+        task.completed_date = datetime.now().isoformat()
+        self._commit_task_change(task)
+        return True
+    
+    def mark_task_in_progress(self, task_id: int):
+        """Mark a task as in progress"""
+        task = self._tasks_by_id.get(task_id)
+        if task is None:
+            return False
+        
+        self._set_task_state(task, TaskStatus.IN_PROGRESS, task.done)
+        self._commit_task_change(task)
+        return True
+    
+    def toggle_task_status(self, task_id: int):
+        """Toggle task completion status"""
+        task = self._tasks_by_id.get(task_id)
+        if task is None:
+            return False
+        
+        done = not task.done
+        self._set_task_state(task, TaskStatus.COMPLETED if done else TaskStatus.PENDING, done)
+        if task.done:
+            task.completed_date = datetime.now().isoformat()
+        else:
+            task.completed_date = None
+        self._commit_task_change(task)
+        return True
+    
+    def update_task_notes(self, task_id: int, notes: str):
+        """Replace the notes on a task"""
+        task = self._tasks_by_id.get(task_id)
+        if task is None:
+            return False
+        
+        task.notes = notes
+        if self._search_index is not None:
+            self._search_index.update(task)
+        self._commit_task_change(task)
+        return True
+    
+    def get_progress_summary(self) -> Dict:
+        """Get comprehensive progress summary from the running counters"""
+        total_tasks = len(self.tasks)
+        completed = len(self._tasks_by_status.get(TaskStatus.COMPLETED, {}))
+        in_progress = len(self._tasks_by_status.get(TaskStatus.IN_PROGRESS, {}))
+        pending = len(self._tasks_by_status.get(TaskStatus.PENDING, {}))
+        total_hours = self._total_hours
+        completed_hours = self._completed_hours
+        categories = {cat: dict(stats) for cat, stats in self._category_stats.items()}
+        
+        summary = {
+            "total_tasks": total_tasks,
+            "completed": completed,
+            "in_progress": in_progress,
+            "pending": pending,
+            "completion_percentage": round((completed / total_tasks) * 100, 1) if total_tasks > 0 else 0,
+            "total_hours": total_hours,
+            "completed_hours": completed_hours,
+            "hours_percentage": round((completed_hours / total_hours) * 100, 1) if total_hours > 0 else 0,
+            "categories": categories
+        }
+        
+        if DEBUG_SUMMARY_CHECK:
+            self.verify_progress_summary(summary)
+        return summary
+    
+    def verify_progress_summary(self, summary: Optional[Dict] = None):
+        """Check the running counters against a full recompute, raising AssertionError on drift"""
+        if summary is None:
+            summary = self.get_progress_summary()
+        expected = self._compute_progress_summary()
+        
+        def close(a, b):
+            return abs(a - b) <= 1e-6 * max(1.0, abs(a), abs(b))
+        
+        for key, value in expected.items():
+            if key == "categories":
+                assert value.keys() == summary[key].keys(), f"category mismatch: {summary[key].keys()} != {value.keys()}"
+                for cat, stats in value.items():
+                    for stat, stat_value in stats.items():
+                        assert close(summary[key][cat][stat], stat_value), f"{cat}.{stat}: {summary[key][cat][stat]} != {stat_value}"
+            else:
+                assert close(summary[key], value), f"{key}: {summary[key]} != {value}"
+    
+    def _compute_progress_summary(self) -> Dict:
+        """Recompute the progress summary from scratch with column operations"""
+        return self.build_task_table().progress_summary()
+    
+    def build_task_table(self) -> TaskTable:
+        """Build a columnar table of the current tasks"""
+        return TaskTable.from_tasks(list(self.tasks))
+    
+    def get_progress_report(self) -> Dict:
+        """Get the progress summary plus per-status, per-day and per-week breakdowns"""
+        return self.build_task_table().progress_report()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Streaming exporters for plan data
+Every format consumes the same plain task records lazily, with progress reporting and
+cancellation, either inline (headless) or on a worker thread (GUI)
+"""
+
+import csv
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+from .json_stream import write_plan
+from .store import TASK_COLUMNS
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    # Optional: without pyarrow the columnar exporter writes column-oriented JSON
+    pyarrow = None
+
+# Configuration
+EXPORT_CHUNK_ROWS = 1000  # Rows between progress updates and cancellation checks
+EXPORT_BUFFER_SIZE = 1024 * 1024  # Output is written to disk in chunks of this size
+
+CSV_HEADER = ['ID', 'Day', 'Title', 'Hours', 'Category', 'Status', 'Done', 'Notes', 'Completed Date']
+COLUMNS_FORMAT = "tracker-columns"
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+class ExportCancelled(Exception):
+    """Raised inside an export when its cancel event is set"""
+
+
+def csv_row(record: Dict) -> list:
+    """Get the CSV columns for one task record"""
+    return [
+        record["id"],
+        record["day"],
+        record["title"],
+        record["hours"],
+        record["category"],
+        record["status"],
+        record["done"],
+        record["notes"],
+        record["completed_date"] or ""
+    ]
+
+
+def _tracked(records: Iterable[Dict], total: Optional[int], progress: Optional[ProgressCallback],
+             cancel: Optional[threading.Event], chunk_rows: int) -> Iterator[Dict]:
+    """Pass records through, reporting progress and checking for cancellation every chunk_rows"""
+    count = 0
+    for record in records:
+        yield record
+        count += 1
+        if count % chunk_rows == 0:
+            if cancel is not None and cancel.is_set():
+                raise ExportCancelled()
+            if progress is not None:
+                progress(count, total)
+    if progress is not None:
+        progress(count, total)
+
+
+@contextmanager
+def _atomic_output(path: str, mode: str = 'w', **kwargs):
+    """Open a temp file that replaces path only if the export completes"""
+    tmp_path = f"{path}.tmp"
+    try:
+        if 'b' in mode:
+            f = open(tmp_path, mode, buffering=EXPORT_BUFFER_SIZE)
+        else:
+            f = open(tmp_path, mode, buffering=EXPORT_BUFFER_SIZE, encoding='utf-8', **kwargs)
+        with f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def export_csv(path: str, records: Iterable[Dict], total: Optional[int] = None,
+               progress: Optional[ProgressCallback] = None, cancel: Optional[threading.Event] = None,
+               chunk_rows: int = EXPORT_CHUNK_ROWS) -> int:
+    """Write task records as CSV; returns the number of rows written"""
+    count = 0
+    with _atomic_output(path, newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        for record in _tracked(records, total, progress, cancel, chunk_rows):
+            writer.writerow(csv_row(record))
+            count += 1
+    return count
+
+
+def export_ndjson(path: str, records: Iterable[Dict], total: Optional[int] = None,
+                  progress: Optional[ProgressCallback] = None, cancel: Optional[threading.Event] = None,
+                  chunk_rows: int = EXPORT_CHUNK_ROWS) -> int:
+    """Write one JSON task record per line; returns the number of records written"""
+    count = 0
+    with _atomic_output(path) as f:
+        for record in _tracked(records, total, progress, cancel, chunk_rows):
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            count += 1
+    return count
+
+
+def export_json(path: str, records: Iterable[Dict], total: Optional[int] = None,
+                progress: Optional[ProgressCallback] = None, cancel: Optional[threading.Event] = None,
+                chunk_rows: int = EXPORT_CHUNK_ROWS, meta: Optional[Dict] = None) -> int:
+    """Write an indented plan file that the tracker can load again; returns the number of tasks written"""
+    with _atomic_output(path) as f:
+        return write_plan(f, meta or {}, _tracked(records, total, progress, cancel, chunk_rows))
+
+
+def export_columnar(path: str, records: Iterable[Dict], total: Optional[int] = None,
+                    progress: Optional[ProgressCallback] = None, cancel: Optional[threading.Event] = None,
+                    chunk_rows: int = EXPORT_CHUNK_ROWS) -> int:
+    """Write task records column by column: Parquet for .parquet paths (needs pyarrow), JSON otherwise"""
+    if path.endswith(".parquet") and pyarrow is None:
+        raise ValueError("Parquet export needs pyarrow; install it or export to .columns.json")
+
+    columns = {name: [] for name in TASK_COLUMNS}
+    appenders = [(name, columns[name].append) for name in TASK_COLUMNS]
+    count = 0
+    for record in _tracked(records, total, progress, cancel, chunk_rows):
+        for name, append in appenders:
+            append(record[name])
+        count += 1
+
+    if path.endswith(".parquet"):
+        with _atomic_output(path, 'wb') as f:
+            pyarrow.parquet.write_table(pyarrow.table(columns), f)
+    else:
+        with _atomic_output(path) as f:
+            f.write(f'{{"format": "{COLUMNS_FORMAT}", "count": {count}, "columns": {{')
+            for index, name in enumerate(TASK_COLUMNS):
+                f.write(("," if index else "") + f"\n  {json.dumps(name)}: {json.dumps(columns[name])}")
+            f.write("\n}}\n")
+    return count
+
+
+class ExportJob:
+    """Runs one export function on a worker thread and tracks its progress"""
+
+    def __init__(self, export: Callable[..., int], path: str, records: Iterable[Dict],
+                 total: Optional[int] = None, **options):
+        self.path = path
+        self.total = total
+        self.written = 0
+        self.result: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.cancelled = False
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(export, records, options),
+                                        name="plan-export", daemon=True)
+
+    def start(self) -> 'ExportJob':
+        """Start the export in the background"""
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Ask the export to stop at the next chunk boundary; the partial file is removed"""
+        self._cancel.set()
+
+    @property
+    def done(self) -> bool:
+        """True once the export has finished, failed or been cancelled"""
+        return self._thread.ident is not None and not self._thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the export to finish"""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _progress(self, written: int, total: Optional[int]):
+        self.written = written
+
+    def _run(self, export: Callable[..., int], records: Iterable[Dict], options: Dict):
+        try:
+            self.result = export(self.path, records, self.total, progress=self._progress,
+                                 cancel=self._cancel, **options)
+        except ExportCancelled:
+            self.cancelled = True
+        except Exception as e:
+            self.error = e
+
+
+# File suffix -> exporter; anything else is exported as a plan JSON file
+EXPORTERS = {
+    ".csv": export_csv,
+    ".ndjson": export_ndjson,
+    ".columns.json": export_columnar,
+    ".parquet": export_columnar
+}
+
+
+def exporter_for(path: str) -> Callable[..., int]:
+    """Pick the exporter for a file name by its suffix"""
+    for suffix, export in EXPORTERS.items():
+        if path.endswith(suffix):
+            return export
+    return export_json
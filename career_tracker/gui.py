@@ -0,0 +1,957 @@
+#!/usr/bin/env python3
+"""
+Tkinter GUI for the tracker
+Only imported when the desktop app starts, so the rest of the package never pays for Tk
+"""
+
+import os
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog, simpledialog
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import webbrowser
+from .core import EnhancedCybersecurityTracker, Task, TaskStatus, STATUS_EMOJI
+from .export import ExportJob, exporter_for, export_json, pyarrow
+try:
+    from tkinter import Calendar
+except ImportError:
+    # Fallback for older Python versions
+    Calendar = None
+
+# Configuration
+VIRTUAL_LIST_THRESHOLD = 2000  # Plans larger than this only materialize the visible task rows
+VIRTUAL_BUFFER_ROWS = 2
+SEARCH_DEBOUNCE_MS = 200  # Wait for typing to pause before filtering
+SAVE_INDICATOR_MS = 250  # How often the status bar checks for pending writes
+CATEGORY_RULES_CHECK_MS = 2000  # How often the GUI checks the category rules file for changes
+EXPORT_PROGRESS_MS = 100  # How often the status bar checks a running export
+
+class DatePickerDialog:
+    def __init__(self, parent, title="Select Date", initial_date=None):
+        self.result = None
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title(title)
+        self.dialog.geometry("300x300")
+        self.dialog.resizable(False, False)
+        self.dialog.transient(parent)
+        self.dialog.grab_set()
+        
+        # Center the dialog
+        self.dialog.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
+        
+        if Calendar:
+            # Use Calendar widget if available
+            self.cal = Calendar(self.dialog, selectmode='day')
+            self.cal.pack(pady=20, padx=20, fill='both', expand=True)
+            
+            # Set initial date
+            if initial_date:
+                try:
+                    date_obj = datetime.strptime(initial_date, "%Y-%m-%d")
+                    self.cal.selection_set(date_obj.date())
+                except:
+                    pass
+        else:
+            # Fallback to simple date entry
+            ttk.Label(self.dialog, text="Enter date (YYYY-MM-DD):").pack(pady=20)
+            self.date_entry = ttk.Entry(self.dialog, width=15)
+            self.date_entry.pack(pady=10)
+            if initial_date:
+                self.date_entry.insert(0, initial_date)
+        
+        # Buttons
+        button_frame = ttk.Frame(self.dialog)
+        button_frame.pack(pady=10)
+        
+        ttk.Button(button_frame, text="OK", command=self.ok_clicked).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.cancel_clicked).pack(side=tk.LEFT, padx=5)
+        
+        # Wait for dialog to close
+        self.dialog.wait_window()
+    
+    def ok_clicked(self):
+        if Calendar and hasattr(self, 'cal'):
+            selected_date = self.cal.selection_get()
+            self.result = selected_date.strftime("%Y-%m-%d")
+        else:
+            # Fallback to entry validation
+            date_str = self.date_entry.get().strip()
+            try:
+                datetime.strptime(date_str, "%Y-%m-%d")
+                self.result = date_str
+            except ValueError:
+                messagebox.showerror("Invalid Date", "Please enter date in YYYY-MM-DD format")
+                return
+        self.dialog.destroy()
+    
+    def cancel_clicked(self):
+        self.result = None
+        self.dialog.destroy()
+
+TREE_COLUMNS = ("Status", "Day", "Hours", "Category", "Title", "ID")
+
+def task_row_values(task: Task) -> tuple:
+    """Get the task tree cell values for a task"""
+    return (
+        STATUS_EMOJI[task.status],
+        task.day,
+        f"{task.hours:.1f}",
+        task.category,
+        task.title,
+        task.id
+    )
+
+class VirtualTaskList:
+    """Shows a large task list in a Treeview by recycling a fixed pool of visible rows"""
+    def __init__(self, tree, scrollbar, buffer_rows: int = VIRTUAL_BUFFER_ROWS):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.buffer_rows = buffer_rows
+        self.tasks: List[Task] = []
+        self.offset = 0
+        self.rows: List[list] = []  # [tree item, values currently shown]
+        self.selected_task_id = None
+        
+        # The scrollbar now drives our offset instead of the tree's own view
+        self.scrollbar.configure(command=self.yview)
+        self.tree.configure(yscrollcommand="")
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1, "units", 3))
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-1, "units", 3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(1, "units", 3))
+        self.tree.bind("<Prior>", lambda e: self.scroll(-1, "pages"))
+        self.tree.bind("<Next>", lambda e: self.scroll(1, "pages"))
+        self.tree.bind("<Up>", lambda e: self.step_selection(-1))
+        self.tree.bind("<Down>", lambda e: self.step_selection(1))
+        self.tree.bind("<<TreeviewSelect>>", self.on_select, add="+")
+        self.tree.bind("<Configure>", lambda e: self.render(), add="+")
+    
+    def set_tasks(self, tasks: List[Task]):
+        """Replace the (already filtered and sorted) task list and redraw"""
+        self.tasks = tasks
+        self.render()
+    
+    def visible_rows(self) -> int:
+        """Number of rows that fit in the tree at its current size"""
+        height = self.tree.winfo_height()
+        if height <= 1:
+            return int(self.tree.cget("height"))
+        try:
+            row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        except (tk.TclError, ValueError):
+            row_height = 20
+        # Leave one row for the column headings
+        return max(1, height // row_height - 1)
+    
+    def scroll(self, amount: int, what: str = "units", repeat: int = 1):
+        """Move the window by rows or pages"""
+        if what == "pages":
+            amount *= self.visible_rows()
+        self.offset += amount * repeat
+        self.render()
+        return "break"
+    
+    def yview(self, *args):
+        """Scrollbar command handler (moveto/scroll)"""
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * len(self.tasks))
+            self.render()
+        elif args[0] == "scroll":
+            self.scroll(int(args[1]), args[2])
+    
+    def step_selection(self, step: int):
+        """Move the selection with the arrow keys, scrolling at the edges of the window"""
+        visible = min(self.visible_rows(), len(self.rows))
+        items = [row[0] for row in self.rows]
+        selection = self.tree.selection()
+        if not selection or selection[0] not in items:
+            return None
+        position = items.index(selection[0])
+        target = position + step
+        if 0 <= target < visible:
+            return None  # Let the tree move the selection itself
+        index = self.offset + position + step
+        if 0 <= index < len(self.tasks):
+            self.selected_task_id = self.tasks[index].id
+            self.scroll(step)
+        return "break"
+    
+    def on_select(self, event=None):
+        """Remember which task is selected so it survives scrolling"""
+        selection = self.tree.selection()
+        if selection:
+            self.selected_task_id = int(self.tree.set(selection[0], "ID"))
+    
+    def render(self):
+        """Fill the row pool with the tasks in the current window"""
+        visible = self.visible_rows()
+        self.offset = max(0, min(self.offset, len(self.tasks) - visible))
+        window = self.tasks[self.offset:self.offset + visible + self.buffer_rows]
+        
+        # Grow or shrink the pool to the window size
+        while len(self.rows) < len(window):
+            self.rows.append([self.tree.insert("", "end"), ()])
+        for item, _ in self.rows[len(window):]:
+            self.tree.delete(item)
+        del self.rows[len(window):]
+        
+        selected_item = None
+        for row, task in zip(self.rows, window):
+            values = task_row_values(task)
+            if values != row[1]:
+                self.tree.item(row[0], values=values)
+                row[1] = values
+            if task.id == self.selected_task_id:
+                selected_item = row[0]
+        
+        if selected_item is not None:
+            self.tree.selection_set(selected_item)
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+        
+        self.tree.yview_moveto(0)
+        if self.tasks:
+            self.scrollbar.set(self.offset / len(self.tasks), min(1.0, (self.offset + visible) / len(self.tasks)))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+class EnhancedGUI:
+    def __init__(self):
+        self.tracker = EnhancedCybersecurityTracker()
+        # Saves from the GUI happen on a writer thread so clicks never wait on disk
+        self.tracker.enable_background_saves()
+        self.root = tk.Tk()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        # Task id -> (tree item, last values written) for differential list updates
+        self.tree_items: Dict[int, Tuple[str, tuple]] = {}
+        self.setup_ui()
+        self.refresh_display()
+        self.root.after(CATEGORY_RULES_CHECK_MS, self.check_category_rules)
+    
+    def setup_ui(self):
+        """Setup the main GUI"""
+        self.root.title("🔐 Enhanced Cybersecurity Job Search Tracker")
+        self.root.geometry("1200x900")  # Increased height to show all buttons
+        self.root.configure(bg='#f0f0f0')
+        
+        # Set application icon
+        try:
+            self.root.iconbitmap("cybersecurity_tracker_icon.ico")
+            print("✅ Icon loaded successfully")
+        except Exception as e:
+            print(f"❌ Icon loading failed: {e}")
+            pass  # If icon file doesn't exist, just continue without it
+        
+        # Configure style
+        style = ttk.Style()
+        style.theme_use('clam')
+        
+        # Main container
+        main_frame = ttk.Frame(self.root)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Header
+        self.create_header(main_frame)
+        
+        # Progress section
+        self.create_progress_section(main_frame)
+        
+        # Main content area
+        content_frame = ttk.Frame(main_frame)
+        content_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        
+        # Left panel - Navigation and filters
+        self.create_left_panel(content_frame)
+        
+        # Right panel - Task list
+        self.create_right_panel(content_frame)
+        
+        # Task actions above status bar
+        self.create_task_actions(main_frame)
+        
+        # Status bar
+        self.create_status_bar(main_frame)
+    
+    def create_header(self, parent):
+        """Create header with key information"""
+        header_frame = ttk.LabelFrame(parent, text="📊 Plan Overview", padding=10)
+        header_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        # Plan dates
+        dates_frame = ttk.Frame(header_frame)
+        dates_frame.pack(fill=tk.X)
+        
+        ttk.Label(dates_frame, text="Start Date:").pack(side=tk.LEFT)
+        self.start_date_var = tk.StringVar(value=self.tracker.start_date or "Not set")
+        start_date_label = ttk.Label(dates_frame, textvariable=self.start_date_var, font=('Arial', 10, 'bold'))
+        start_date_label.pack(side=tk.LEFT, padx=(5, 5))
+        start_date_label.bind("<Button-1>", self.pick_start_date)
+        
+        ttk.Button(dates_frame, text="📅", command=self.pick_start_date, width=3).pack(side=tk.LEFT, padx=(0, 20))
+        
+        ttk.Label(dates_frame, text="Duration:").pack(side=tk.LEFT)
+        self.duration_var = tk.StringVar(value=str(self.tracker.total_days))
+        duration_spinbox = ttk.Spinbox(dates_frame, from_=7, to=365, width=5, textvariable=self.duration_var, command=self.update_duration)
+        duration_spinbox.pack(side=tk.LEFT, padx=(5, 5))
+        duration_spinbox.bind('<Return>', self.update_duration)
+        
+        ttk.Label(dates_frame, text="days").pack(side=tk.LEFT, padx=(0, 20))
+        
+        ttk.Label(dates_frame, text="End Date:").pack(side=tk.LEFT)
+        self.end_date_var = tk.StringVar(value=self.tracker.end_date or "Not set")
+        end_date_label = ttk.Label(dates_frame, textvariable=self.end_date_var, font=('Arial', 10, 'bold'))
+        end_date_label.pack(side=tk.LEFT, padx=(5, 5))
+        end_date_label.bind("<Button-1>", self.pick_end_date)
+        
+        ttk.Button(dates_frame, text="📅", command=self.pick_end_date, width=3).pack(side=tk.LEFT, padx=(0, 20))
+        
+        ttk.Label(dates_frame, text="Current Day:").pack(side=tk.LEFT)
+        self.current_day_var = tk.StringVar()
+        ttk.Label(dates_frame, textvariable=self.current_day_var, font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=(5, 20))
+        
+        # Export button next to current day
+        ttk.Button(dates_frame, text="📤 Export Data", command=self.export_data).pack(side=tk.LEFT, padx=5)
+        
+        # Day selection frame below the main dates
+        day_selection_frame = ttk.Frame(header_frame)
+        day_selection_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        ttk.Label(day_selection_frame, text="Skip days:").pack(side=tk.LEFT, padx=(0, 5))
+        
+        # Day checkboxes
+        self.day_vars = {}
+        day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+        for i, day_name in enumerate(day_names):
+            var = tk.BooleanVar(value=i in self.tracker.skip_days)
+            self.day_vars[i] = var
+            cb = ttk.Checkbutton(day_selection_frame, text=day_name, variable=var, 
+                               command=lambda d=i: self.update_day_selection(d))
+            cb.pack(side=tk.LEFT, padx=1)
+        
+        # Quick actions
+        actions_frame = ttk.Frame(header_frame)
+        actions_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        ttk.Button(actions_frame, text="📅 Today's Tasks", command=self.show_today).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(actions_frame, text="📊 Progress Report", command=self.show_progress_report).pack(side=tk.LEFT, padx=5)
+        ttk.Button(actions_frame, text="💾 Backup Data", command=self.backup_data).pack(side=tk.LEFT, padx=5)
+    
+    def create_progress_section(self, parent):
+        """Create progress visualization section"""
+        progress_frame = ttk.LabelFrame(parent, text="📈 Progress", padding=10)
+        progress_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        # Progress bars
+        bars_frame = ttk.Frame(progress_frame)
+        bars_frame.pack(fill=tk.X)
+        
+        # Tasks progress
+        ttk.Label(bars_frame, text="Tasks:").pack(side=tk.LEFT)
+        self.tasks_progress = ttk.Progressbar(bars_frame, length=200, mode='determinate')
+        self.tasks_progress.pack(side=tk.LEFT, padx=(5, 20))
+        self.tasks_progress_label = ttk.Label(bars_frame, text="0%")
+        self.tasks_progress_label.pack(side=tk.LEFT)
+        
+        # Hours progress
+        ttk.Label(bars_frame, text="Hours:").pack(side=tk.LEFT, padx=(20, 0))
+        self.hours_progress = ttk.Progressbar(bars_frame, length=200, mode='determinate')
+        self.hours_progress.pack(side=tk.LEFT, padx=(5, 20))
+        self.hours_progress_label = ttk.Label(bars_frame, text="0%")
+        self.hours_progress_label.pack(side=tk.LEFT)
+        
+        # Summary stats
+        self.summary_label = ttk.Label(progress_frame, text="", font=('Arial', 9))
+        self.summary_label.pack(pady=(10, 0))
+    
+    def create_left_panel(self, parent):
+        """Create left panel with navigation and filters"""
+        left_frame = ttk.LabelFrame(parent, text="🎯 Navigation & Filters", padding=10)
+        left_frame.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 10))
+        
+        # Week navigation
+        week_frame = ttk.LabelFrame(left_frame, text="📅 Week Navigation", padding=5)
+        week_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        self.week_buttons = []
+        self.update_week_buttons()
+        
+        # Category filters
+        category_frame = ttk.LabelFrame(left_frame, text="🏷️ Categories", padding=5)
+        category_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        self.category_var = tk.StringVar(value="All")
+        categories = ["All", "Behind Schedule"] + list(set(task.category for task in self.tracker.tasks))
+        
+        for category in categories:
+            if category == "Behind Schedule":
+                # Add special styling for behind schedule
+                behind_count = len(self.tracker.get_behind_schedule_tasks())
+                text = f"🚨 Behind Schedule ({behind_count})" if behind_count > 0 else "Behind Schedule (0)"
+                ttk.Radiobutton(category_frame, text=text, variable=self.category_var, 
+                               value=category, command=self.filter_tasks).pack(anchor=tk.W)
+            else:
+                ttk.Radiobutton(category_frame, text=category, variable=self.category_var, 
+                               value=category, command=self.filter_tasks).pack(anchor=tk.W)
+        
+        # Status filters
+        status_frame = ttk.LabelFrame(left_frame, text="📊 Status", padding=5)
+        status_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        self.status_var = tk.StringVar(value="All")
+        statuses = ["All", "Pending", "In Progress", "Completed"]
+        
+        for status in statuses:
+            ttk.Radiobutton(status_frame, text=status, variable=self.status_var, 
+                           value=status, command=self.filter_tasks).pack(anchor=tk.W)
+        
+        # Search
+        search_frame = ttk.LabelFrame(left_frame, text="🔍 Search", padding=5)
+        search_frame.pack(fill=tk.X)
+        
+        self.search_var = tk.StringVar()
+        self._search_after_id = None
+        self.search_var.trace('w', self.schedule_search)
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        search_entry.pack(fill=tk.X, pady=(0, 5))
+        
+        ttk.Button(search_frame, text="Clear Filters", command=self.clear_filters).pack(fill=tk.X)
+    
+    def create_right_panel(self, parent):
+        """Create right panel with task list"""
+        right_frame = ttk.LabelFrame(parent, text="📋 Tasks", padding=10)
+        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        
+        # Task list
+        columns = TREE_COLUMNS
+        self.task_tree = ttk.Treeview(right_frame, columns=columns, show="headings", height=20)
+        
+        # Configure columns
+        self.task_tree.heading("Status", text="Status")
+        self.task_tree.column("Status", width=80, anchor="center")
+        
+        self.task_tree.heading("Day", text="Day")
+        self.task_tree.column("Day", width=50, anchor="center")
+        
+        self.task_tree.heading("Hours", text="Hours")
+        self.task_tree.column("Hours", width=60, anchor="center")
+        
+        self.task_tree.heading("Category", text="Category")
+        self.task_tree.column("Category", width=100, anchor="center")
+        
+        self.task_tree.heading("Title", text="Task Title")
+        self.task_tree.column("Title", width=400, anchor="w")
+        
+        self.task_tree.heading("ID", text="ID")
+        self.task_tree.column("ID", width=50, anchor="center")
+        
+        # Scrollbar
+        scrollbar = ttk.Scrollbar(right_frame, orient=tk.VERTICAL, command=self.task_tree.yview)
+        self.task_tree.configure(yscrollcommand=scrollbar.set)
+        
+        # Pack widgets
+        self.task_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Large plans only create rows for the visible window
+        self.virtual_list = None
+        if len(self.tracker.tasks) > VIRTUAL_LIST_THRESHOLD:
+            self.virtual_list = VirtualTaskList(self.task_tree, scrollbar)
+        
+        # Bind double-click
+        self.task_tree.bind("<Double-1>", lambda e: self.toggle_status())
+    
+    def create_task_actions(self, parent):
+        """Create task action buttons above status bar"""
+        actions_frame = ttk.Frame(parent)
+        actions_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        ttk.Button(actions_frame, text="✅ Mark Complete", command=self.mark_complete).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(actions_frame, text="🔄 Mark In Progress", command=self.mark_in_progress).pack(side=tk.LEFT, padx=5)
+        ttk.Button(actions_frame, text="📝 Add Notes", command=self.add_notes).pack(side=tk.LEFT, padx=5)
+        ttk.Button(actions_frame, text="🔄 Toggle Status", command=self.toggle_status).pack(side=tk.LEFT, padx=5)
+    
+    def create_status_bar(self, parent):
+        """Create status bar"""
+        status_frame = ttk.Frame(parent)
+        status_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        self.status_var = tk.StringVar(value="Ready")
+        status_bar = ttk.Label(status_frame, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
+        status_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Pending background write indicator
+        self.save_indicator_var = tk.StringVar(value="")
+        ttk.Label(status_frame, textvariable=self.save_indicator_var, relief=tk.SUNKEN, width=14,
+                  anchor=tk.CENTER).pack(side=tk.RIGHT)
+        self.update_save_indicator()
+        
+        # Export progress, only shown while an export is running
+        self.export_job = None
+        self.export_cancel_button = ttk.Button(status_frame, text="Cancel", command=self.cancel_export)
+        self.export_progress = ttk.Progressbar(status_frame, mode='determinate', length=150)
+    
+    def update_save_indicator(self):
+        """Show whether changes are still waiting to be written"""
+        writer = self.tracker.writer
+        if writer is None:
+            text = ""
+        elif writer.last_error is not None:
+            text = "⚠️ Save failed"
+        elif writer.pending:
+            text = "💾 Saving..."
+        else:
+            text = "✔ Saved"
+        self.save_indicator_var.set(text)
+        self.root.after(SAVE_INDICATOR_MS, self.update_save_indicator)
+    
+    def check_category_rules(self):
+        """Pick up edits to the category rules file without a restart"""
+        changed = self.tracker.reload_category_rules()
+        if changed:
+            self.refresh_display()
+            self.status_var.set(f"🏷️ Category rules reloaded: {changed} tasks re-categorized")
+        self.root.after(CATEGORY_RULES_CHECK_MS, self.check_category_rules)
+    
+    def pick_start_date(self, event=None):
+        """Open calendar picker for start date"""
+        dialog = DatePickerDialog(self.root, "Select Start Date", self.tracker.start_date)
+        if dialog.result:
+            self.tracker.start_date = dialog.result
+            self.update_end_date()
+            self.tracker.save_state()
+            self.refresh_display()
+    
+    def pick_end_date(self, event=None):
+        """Open calendar picker for end date"""
+        dialog = DatePickerDialog(self.root, "Select End Date", self.tracker.end_date)
+        if dialog.result:
+            self.tracker.end_date = dialog.result
+            self.update_duration_from_dates()
+            self.tracker.save_state()
+            self.refresh_display()
+    
+    def update_duration(self, event=None):
+        """Update plan duration"""
+        try:
+            new_duration = int(self.duration_var.get())
+            if 7 <= new_duration <= 365:
+                self.tracker.total_days = new_duration
+                self.update_end_date()
+                self.tracker.save_state()
+                self.refresh_display()
+            else:
+                messagebox.showerror("Invalid Duration", "Duration must be between 7 and 365 days")
+                self.duration_var.set(str(self.tracker.total_days))
+        except ValueError:
+            messagebox.showerror("Invalid Duration", "Please enter a valid number")
+            self.duration_var.set(str(self.tracker.total_days))
+    
+    def update_end_date(self):
+        """Update end date based on start date and duration"""
+        if self.tracker.start_date:
+            start = datetime.strptime(self.tracker.start_date, "%Y-%m-%d")
+            end = start + timedelta(days=self.tracker.total_days - 1)
+            self.tracker.end_date = end.strftime("%Y-%m-%d")
+    
+    def update_duration_from_dates(self):
+        """Update duration based on start and end dates"""
+        if self.tracker.start_date and self.tracker.end_date:
+            start = datetime.strptime(self.tracker.start_date, "%Y-%m-%d")
+            end = datetime.strptime(self.tracker.end_date, "%Y-%m-%d")
+            
+            # Calculate total days including both start and end dates
+            total_days = (end - start).days + 1
+            
+            if total_days >= 1:
+                self.tracker.total_days = total_days
+                self.duration_var.set(str(total_days))
+            else:
+                messagebox.showerror("Invalid Date Range", "End date must be after start date")
+                # Reset to previous end date
+                self.update_end_date()
+    
+    def update_day_selection(self, day_index):
+        """Update which days to skip based on checkbox selection"""
+        skip_days = [i for i, var in self.day_vars.items() if var.get()]
+        self.tracker.update_skip_days(skip_days)
+        self.refresh_display()
+        
+        # Get the day name for the specific day that was just changed
+        day_name = self.tracker.get_day_name(day_index)
+        is_checked = self.day_vars[day_index].get()
+        
+        if is_checked:
+            messagebox.showinfo("Day Selection", f"Now skipping {day_name}")
+        else:
+            messagebox.showinfo("Day Selection", f"Now doing {day_name}")
+    
+    def update_week_buttons(self):
+        """Update week navigation buttons based on plan duration"""
+        # Find the week frame
+        week_frame = None
+        for child in self.root.winfo_children():
+            if isinstance(child, ttk.Frame):
+                for grandchild in child.winfo_children():
+                    if isinstance(grandchild, ttk.LabelFrame) and "Week Navigation" in str(grandchild.cget("text")):
+                        week_frame = grandchild
+                        break
+                if week_frame:
+                    break
+        
+        if week_frame:
+            # Clear existing buttons
+            for button in self.week_buttons:
+                button.destroy()
+            self.week_buttons.clear()
+            
+            # Calculate number of weeks
+            total_weeks = (self.tracker.total_days + 6) // 7  # Round up
+            
+            # Create week buttons
+            for week in range(1, total_weeks + 1):
+                button = ttk.Button(week_frame, text=f"Week {week}", 
+                                  command=lambda w=week: self.show_week(w))
+                button.pack(fill=tk.X, pady=2)
+                self.week_buttons.append(button)
+    
+    def refresh_display(self):
+        """Refresh all display elements"""
+        # Update header
+        self.start_date_var.set(self.tracker.start_date or "Not set")
+        self.end_date_var.set(self.tracker.end_date or "Not set")
+        self.duration_var.set(str(self.tracker.total_days))
+        current_day = self.tracker.get_current_day()
+        skip_info = ""
+        if self.tracker.skip_days:
+            skip_names = self.tracker.get_skip_days_names()
+            skip_info = f" (skipping: {', '.join(skip_names)})"
+        self.current_day_var.set(f"{current_day}/{self.tracker.total_days}{skip_info}")
+        
+        # Update progress
+        summary = self.tracker.get_progress_summary()
+        self.tasks_progress['value'] = summary['completion_percentage']
+        self.tasks_progress_label.config(text=f"{summary['completion_percentage']}%")
+        
+        self.hours_progress['value'] = summary['hours_percentage']
+        self.hours_progress_label.config(text=f"{summary['hours_percentage']}%")
+        
+        self.summary_label.config(
+            text=f"Completed: {summary['completed']}/{summary['total_tasks']} tasks "
+                 f"({summary['completed_hours']:.1f}/{summary['total_hours']:.1f} hours)"
+        )
+        
+        # Update week buttons
+        self.update_week_buttons()
+        
+        # Update task list
+        self.filter_tasks()
+    
+    def schedule_search(self, *args):
+        """Filter once typing in the search box pauses"""
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self.filter_tasks)
+    
+    def filter_tasks(self, *args):
+        """Filter tasks based on current filters"""
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        
+        # Get filter values
+        category_filter = self.category_var.get()
+        status_filter = self.status_var.get()
+        search_term = self.search_var.get().lower()
+        matching_ids = self.tracker.search_task_ids(search_term) if search_term else None
+        
+        # Filter tasks
+        filtered_tasks = []
+        
+        # Handle "Behind Schedule" category specially
+        if category_filter == "Behind Schedule":
+            filtered_tasks = self.tracker.get_behind_schedule_tasks()
+        elif category_filter != "All":
+            filtered_tasks = self.tracker.get_tasks_by_category(category_filter)
+        else:
+            filtered_tasks = list(self.tracker.tasks)
+        
+        # Apply status and search filters to all filtered tasks
+        final_filtered_tasks = []
+        for task in filtered_tasks:
+            # Status filter
+            if status_filter != "All":
+                if status_filter == "Pending" and task.status != TaskStatus.PENDING:
+                    continue
+                elif status_filter == "In Progress" and task.status != TaskStatus.IN_PROGRESS:
+                    continue
+                elif status_filter == "Completed" and task.status != TaskStatus.COMPLETED:
+                    continue
+            
+            # Search filter
+            if matching_ids is not None and task.id not in matching_ids:
+                continue
+            
+            final_filtered_tasks.append(task)
+        
+        filtered_tasks = final_filtered_tasks
+        
+        # Sort by day, then by created order
+        filtered_tasks.sort(key=lambda t: (t.day, t.created_order))
+        
+        self.show_tasks_in_tree(filtered_tasks)
+    
+    def show_tasks_in_tree(self, tasks: List[Task]):
+        """Make the task tree show exactly these tasks, touching only rows that changed"""
+        if self.virtual_list is not None:
+            self.virtual_list.set_tasks(tasks)
+            return
+        
+        visible = []
+        for task in tasks:
+            values = task_row_values(task)
+            entry = self.tree_items.get(task.id)
+            if entry is None:
+                item = self.task_tree.insert("", "end", values=values)
+            else:
+                item, old_values = entry
+                if values != old_values:
+                    for column, old, new in zip(TREE_COLUMNS, old_values, values):
+                        if old != new:
+                            self.task_tree.set(item, column, new)
+            self.tree_items[task.id] = (item, values)
+            visible.append(item)
+        
+        # Forget rows for tasks that no longer exist (e.g. after a plan reload)
+        for task_id in [task_id for task_id in self.tree_items if self.tracker.get_task(task_id) is None]:
+            self.task_tree.delete(self.tree_items.pop(task_id)[0])
+        
+        # One call detaches filtered-out rows, reattaches returning ones and fixes the order
+        if tuple(visible) != self.task_tree.get_children():
+            self.task_tree.set_children("", *visible)
+    
+    def clear_filters(self):
+        """Clear all filters"""
+        self.category_var.set("All")
+        self.status_var.set("All")
+        self.search_var.set("")
+        self.filter_tasks()
+    
+    def show_today(self):
+        """Show today's tasks"""
+        self.category_var.set("All")
+        self.status_var.set("All")
+        self.search_var.set("")
+        
+        # Filter to today's tasks
+        today_tasks = self.tracker.get_today_tasks()
+        if today_tasks:
+            self.status_var.set("All")  # Show all statuses for today
+            self.filter_tasks()
+            self.status_var.set("All")
+            messagebox.showinfo("Today's Tasks", f"You have {len(today_tasks)} tasks scheduled for today!")
+        else:
+            messagebox.showinfo("Today's Tasks", "No tasks scheduled for today!")
+    
+    def show_week(self, week: int):
+        """Show tasks for a specific week"""
+        week_tasks = self.tracker.get_week_tasks(week)
+        if week_tasks:
+            # Clear filters and show week tasks
+            self.clear_filters()
+            # Filter to show only this week's tasks
+            self.show_tasks_in_tree(week_tasks)
+            
+            messagebox.showinfo(f"Week {week}", f"Week {week} has {len(week_tasks)} tasks scheduled!")
+        else:
+            messagebox.showinfo(f"Week {week}", f"No tasks found for week {week}")
+    
+    def show_progress_report(self):
+        """Show detailed progress report"""
+        summary = self.tracker.get_progress_report()
+        
+        report = f"""📊 DETAILED PROGRESS REPORT
+{'='*50}
+
+📈 Overall Progress:
+• Tasks: {summary['completed']}/{summary['total_tasks']} ({summary['completion_percentage']}%)
+• Hours: {summary['completed_hours']:.1f}/{summary['total_hours']:.1f} ({summary['hours_percentage']}%)
+
+📊 Status Breakdown:
+• ✅ Completed: {summary['completed']}
+• 🔄 In Progress: {summary['in_progress']}
+• ⏳ Pending: {summary['pending']}
+
+🏷️ Category Progress:"""
+        
+        for category, stats in summary['categories'].items():
+            cat_percentage = (stats['completed'] / stats['total'] * 100) if stats['total'] > 0 else 0
+            report += f"\n• {category}: {stats['completed']}/{stats['total']} ({cat_percentage:.1f}%)"
+        
+        report += "\n\n📅 Weekly Progress:"
+        for week, stats in summary['weeks'].items():
+            report += f"\n• Week {week}: {stats['completed']}/{stats['total']} tasks ({stats['completed_hours']:.1f}/{stats['hours']:.1f} hours)"
+        
+        messagebox.showinfo("Progress Report", report)
+    
+    def mark_complete(self):
+        """Mark selected task as complete"""
+        selection = self.task_tree.selection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Please select a task to mark as complete.")
+            return
+        
+        item = selection[0]
+        task_id = int(self.task_tree.set(item, "ID"))
+        
+        notes = simpledialog.askstring("Add Notes", "Add completion notes (optional):")
+        if self.tracker.mark_task_complete(task_id, notes or ""):
+            self.refresh_display()
+            self.status_var.set("Task marked as complete!")
+        else:
+            messagebox.showerror("Error", "Failed to mark task as complete.")
+    
+    def mark_in_progress(self):
+        """Mark selected task as in progress"""
+        selection = self.task_tree.selection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Please select a task to mark as in progress.")
+            return
+        
+        item = selection[0]
+        task_id = int(self.task_tree.set(item, "ID"))
+        
+        if self.tracker.mark_task_in_progress(task_id):
+            self.refresh_display()
+            self.status_var.set("Task marked as in progress!")
+        else:
+            messagebox.showerror("Error", "Failed to mark task as in progress.")
+    
+    def toggle_status(self):
+        """Toggle task completion status"""
+        selection = self.task_tree.selection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Please select a task to toggle.")
+            return
+        
+        item = selection[0]
+        task_id = int(self.task_tree.set(item, "ID"))
+        
+        if self.tracker.toggle_task_status(task_id):
+            self.refresh_display()
+            self.status_var.set("Task status toggled!")
+        else:
+            messagebox.showerror("Error", "Failed to toggle task status.")
+    
+    def add_notes(self):
+        """Add notes to selected task"""
+        selection = self.task_tree.selection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Please select a task to add notes to.")
+            return
+        
+        item = selection[0]
+        task_id = int(self.task_tree.set(item, "ID"))
+        
+        task = self.tracker.get_task(task_id)
+        if task:
+            current_notes = task.notes
+            notes = simpledialog.askstring("Add Notes", f"Add notes for '{task.title}':", initialvalue=current_notes)
+            if notes is not None:
+                self.tracker.update_task_notes(task_id, notes)
+                self.refresh_display()
+                self.status_var.set("Notes updated!")
+        else:
+            messagebox.showerror("Error", "Task not found.")
+    
+    def backup_data(self):
+        """Create a backup of current data"""
+        try:
+            self.tracker.save_state()  # This already creates backups
+            # With background saves, save_state only queues the write
+            writer = self.tracker.writer
+            if writer is not None and not writer.flush():
+                messagebox.showerror("Backup Error", f"Failed to create backup: {writer.last_error}")
+                return
+            messagebox.showinfo("Backup Created", f"Data backed up to {self.tracker.backup_dir}")
+        except Exception as e:
+            messagebox.showerror("Backup Error", f"Failed to create backup: {e}")
+    
+    def export_data(self):
+        """Export data to JSON, CSV, NDJSON or a columnar format"""
+        filetypes = [("JSON files", "*.json"), ("CSV files", "*.csv"),
+                     ("Newline-delimited JSON", "*.ndjson"), ("Columnar JSON", "*.columns.json")]
+        if pyarrow is not None:
+            filetypes.append(("Parquet files", "*.parquet"))
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=filetypes,
+            title="Export Data"
+        )
+        
+        if not file_path:
+            return
+        
+        export = exporter_for(file_path)
+        if export is export_json:
+            self.start_export(export, file_path, meta=self.tracker.get_export_meta())
+        else:
+            self.start_export(export, file_path)
+    
+    def start_export(self, export, file_path: str, **options):
+        """Run an exporter on a worker thread, showing progress in the status bar"""
+        if self.export_job is not None:
+            messagebox.showwarning("Export Running", "Wait for the current export to finish or cancel it first.")
+            return
+        
+        total = len(self.tracker.tasks)
+        self.export_job = ExportJob(export, file_path, self.tracker.iter_task_records(), total, **options).start()
+        self.export_progress.config(maximum=max(total, 1), value=0)
+        self.export_cancel_button.pack(side=tk.RIGHT)
+        self.export_progress.pack(side=tk.RIGHT, padx=5)
+        self.status_var.set(f"📤 Exporting {total} tasks to {os.path.basename(file_path)}...")
+        self.root.after(EXPORT_PROGRESS_MS, self.poll_export)
+    
+    def poll_export(self):
+        """Update the export progress bar and report the result once the worker is done"""
+        job = self.export_job
+        self.export_progress.config(value=job.written)
+        if not job.done:
+            self.root.after(EXPORT_PROGRESS_MS, self.poll_export)
+            return
+        
+        self.export_job = None
+        self.export_progress.pack_forget()
+        self.export_cancel_button.pack_forget()
+        if job.cancelled:
+            self.status_var.set("⏹️ Export cancelled")
+        elif job.error is not None:
+            self.status_var.set("❌ Export failed")
+            messagebox.showerror("Export Error", f"Failed to export data: {job.error}")
+        else:
+            self.status_var.set(f"✅ Exported {job.result} tasks")
+            messagebox.showinfo("Export Complete", f"Data exported to {job.path}")
+    
+    def cancel_export(self):
+        """Stop the running export"""
+        if self.export_job is not None:
+            self.export_job.cancel()
+    
+    def on_close(self):
+        """Save pending changes before closing, and ask before quitting if that fails"""
+        writer = self.tracker.writer
+        if writer is not None and not writer.flush():
+            if not messagebox.askyesno(
+                    "Save Failed",
+                    f"Your latest changes could not be saved:\n{writer.last_error}\n\n"
+                    "Quit anyway and lose them?"):
+                return
+        self.root.destroy()
+    
+    def run(self):
+        """Start the GUI application"""
+        try:
+            self.root.mainloop()
+        finally:
+            # Make sure coalesced writes reach disk before the process exits
+            error = self.tracker.close()
+            if error is not None:
+                print(f"❌ Changes were not saved before exit: {error}")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Append-only write-ahead journal for tracker mutations
+Each task change is written as one JSON line instead of rewriting the whole plan
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+# Configuration
+JOURNAL_FILE = "enhanced_plan_state.journal"
+COMPACT_EVERY = 500  # Fold the journal into the snapshot after this many records
+BASE_OP = "base"  # Op of the first record: the plan_id of the snapshot the journal applies to
+
+
+class PlanJournal:
+    def __init__(self, path: str = JOURNAL_FILE, compact_every: int = COMPACT_EVERY, fsync: bool = True):
+        self.path = path
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.record_count = 0
+        self.base: Optional[str] = None  # plan_id written at the top of a new journal file
+        self._handle = None
+        self._lock = threading.Lock()  # Appends may race a background compaction
+
+    def append(self, op: str, task_id: Optional[int] = None, fields: Optional[Dict] = None):
+        """Append a single mutation record to the journal"""
+        record = {"op": op, "ts": datetime.now().isoformat()}
+        if task_id is not None:
+            record["id"] = task_id
+        if fields:
+            record["fields"] = fields
+
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._handle is None:
+                self._handle = open(self.path, 'a', encoding='utf-8')
+                if not self._handle.tell():
+                    # Tie a new journal to the snapshot it is written on top of
+                    if self.base is not None:
+                        line = json.dumps({"op": BASE_OP, "base": self.base}, separators=(",", ":")) + "\n" + line
+                elif not self._ends_with_newline():
+                    # Never glue a record onto an unterminated last line
+                    line = "\n" + line
+            self._handle.write(line)
+            self._handle.flush()
+            if self.fsync:
+                os.fsync(self._handle.fileno())
+            self.record_count += 1
+
+    def replay(self, base: Optional[str] = None, repair: bool = True) -> Iterator[Dict]:
+        """Yield every complete record written on top of the plan with the given plan_id, oldest first
+
+        A journal left over from another plan (e.g. before a new plan file was dropped in) is discarded and a
+        torn tail is cut off, unless repair=False, which only reads the file (for readers that do not own it)
+        """
+        self.record_count = 0
+        self.base = base
+        if not os.path.exists(self.path):
+            return
+
+        # Byte offset just past the last complete record
+        intact = 0
+        torn = False
+        stale = False
+        first = True
+        with open(self.path, 'rb') as f:
+            for raw in f:
+                line = raw.strip()
+                if line:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn final line from a crash mid-append; everything before it is intact
+                        torn = True
+                        break
+                intact += len(raw)
+                if not line:
+                    continue
+                if first:
+                    first = False
+                    # Journals written before plans had an id have no base record
+                    is_base = record.get("op") == BASE_OP
+                    if (record.get("base") if is_base else None) != base:
+                        stale = True
+                        break
+                    if is_base:
+                        continue
+                self.record_count += 1
+                yield record
+
+        if not repair:
+            return
+        if stale:
+            print(f"⚠️ Discarding {self.path}: it was written for a different plan file")
+            with self._lock:
+                self._close()
+                os.remove(self.path)
+        elif torn:
+            # Cut the torn tail off so later appends do not land behind it and get dropped too
+            print(f"⚠️ Discarding incomplete journal record in {self.path}")
+            with self._lock:
+                self._close()
+                os.truncate(self.path, intact)
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def needs_compaction(self) -> bool:
+        """Check whether the journal has grown past the compaction threshold"""
+        return self.record_count >= self.compact_every
+
+    def truncate(self, expected_count: Optional[int] = None) -> bool:
+        """Discard all records once they have been folded into the snapshot"""
+        with self._lock:
+            # Records appended after the snapshot was taken must survive; replaying
+            # the already-saved ones on top of the new snapshot is harmless
+            if expected_count is not None and self.record_count != expected_count:
+                return False
+            self._close()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self.record_count = 0
+            return True
+
+    def close(self):
+        """Close the append handle if one is open"""
+        with self._lock:
+            self._close()
+
+    def _close(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
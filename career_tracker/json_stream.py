@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Streaming reader and writer for the plan JSON format
+Tasks are encoded and decoded one at a time so large plans never sit in memory as one string
+Each task is decoded whole, notes included: finding a field to skip in Python costs more than the C decoder
+spends on it
+"""
+
+import json
+from typing import Dict, Iterable, Iterator, TextIO, Tuple
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = " \t\n\r"
+DELIMITERS = WHITESPACE + ",:]}"
+
+
+def write_plan(f: TextIO, meta: Dict, tasks: Iterable[Dict], compact: bool = False) -> int:
+    """Write a plan task by task; indented output matches json.dump(indent=2)"""
+    if compact:
+        def encode(value, depth):
+            return json.dumps(value, separators=(",", ":"))
+        newline, key_sep = "", ":"
+    else:
+        def encode(value, depth):
+            return json.dumps(value, indent=2).replace("\n", "\n" + "  " * depth)
+        newline, key_sep = "\n", ": "
+
+    pad = "" if compact else "  "
+    f.write("{" + newline)
+    for key, value in meta.items():
+        f.write(f"{pad}{json.dumps(key)}{key_sep}{encode(value, 1)},{newline}")
+
+    f.write(f"{pad}\"tasks\"{key_sep}[")
+    count = 0
+    for task in tasks:
+        f.write(("," if count else "") + newline + pad * 2 + encode(task, 2))
+        count += 1
+    if count:
+        f.write(newline + pad)
+    f.write("]" + newline + "}")
+    return count
+
+
+def read_plan(f: TextIO) -> Tuple[Dict, Iterator[Dict]]:
+    """Stream a plan file; returns (meta, task iterator)"""
+    # meta is filled in as the iterator is consumed, so it is only complete once the tasks are exhausted
+    meta: Dict = {}
+    return meta, _iter_tasks(_Tokenizer(f), meta)
+
+
+def _iter_tasks(tokens: '_Tokenizer', meta: Dict) -> Iterator[Dict]:
+    tokens.expect("{")
+    if tokens.peek() == "}":
+        return
+    while True:
+        key = tokens.value()
+        tokens.expect(":")
+        if key == "tasks" and tokens.peek() == "[":
+            tokens.expect("[")
+            if tokens.peek() != "]":
+                while True:
+                    yield tokens.value()
+                    separator = tokens.next_char()
+                    if separator == "]":
+                        break
+                    if separator != ",":
+                        raise ValueError(f"Expected ',' or ']' in plan file, found {separator!r}")
+            else:
+                tokens.expect("]")
+        else:
+            meta[key] = tokens.value()
+
+        separator = tokens.next_char()
+        if separator == "}":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or '}}' in plan file, found {separator!r}")
+
+
+class _Tokenizer:
+    """Incremental tokenizer over a text stream, decoding one JSON value at a time"""
+
+    def __init__(self, f: TextIO):
+        self.f = f
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _skip_whitespace(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return
+
+    def peek(self) -> str:
+        """Get the next non-whitespace character without consuming it"""
+        self._skip_whitespace()
+        if self.pos >= len(self.buffer):
+            raise ValueError("Unexpected end of plan file")
+        return self.buffer[self.pos]
+
+    def next_char(self) -> str:
+        """Consume and return the next non-whitespace character"""
+        char = self.peek()
+        self.pos += 1
+        return char
+
+    def expect(self, char: str):
+        """Consume the next character, which must be char"""
+        found = self.next_char()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in plan file, found {found!r}")
+
+    def value(self):
+        """Decode the next complete JSON value"""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number cut off by the chunk boundary still decodes, so require a delimiter after it
+            if (end >= len(self.buffer) or self.buffer[end] not in DELIMITERS) and self._fill():
+                continue
+            self.pos = end
+            return value
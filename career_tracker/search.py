@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Trigram search index over task titles and notes
+Supports case-insensitive substring search without rescanning every task
+"""
+
+from array import array
+from typing import Dict, Iterable, Set
+
+NGRAM = 3
+SEPARATOR = "\x00"  # Joins title and notes so a match cannot span the two
+
+
+class TaskSearchIndex:
+    def __init__(self, tasks: Iterable = ()):
+        self._texts: Dict[int, str] = {}
+        # Posting lists may hold stale or duplicate ids; every candidate is verified against _texts
+        self._postings: Dict[str, array] = {}
+        self._last_query = ""
+        self._last_matches: Set[int] = set()
+        for task in tasks:
+            self._add(task)
+
+    def _add(self, task):
+        text = f"{task.title}{SEPARATOR}{task.notes}".lower()
+        self._texts[task.id] = text
+        for gram in {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}:
+            postings = self._postings.get(gram)
+            if postings is None:
+                postings = self._postings[gram] = array('q')
+            postings.append(task.id)
+
+    def update(self, task):
+        """Re-index a task after its title or notes changed"""
+        self._add(task)
+        self._last_query = ""
+        self._last_matches = set()
+
+    def remove(self, task_id: int):
+        """Drop a task from the index"""
+        self._texts.pop(task_id, None)
+        self._last_matches.discard(task_id)
+
+    def search(self, query: str) -> Set[int]:
+        """Get ids of tasks whose title or notes contain the query (case-insensitive)"""
+        query = query.lower()
+        if not query:
+            return set(self._texts)
+
+        # Extending the previous query can only narrow its matches
+        if self._last_query and self._last_query in query:
+            candidates = self._last_matches
+        elif len(query) < NGRAM:
+            candidates = self._texts.keys()
+        else:
+            grams = {query[i:i + NGRAM] for i in range(len(query) - NGRAM + 1)}
+            postings = [self._postings.get(gram) for gram in grams]
+            if any(p is None for p in postings):
+                candidates = ()
+            else:
+                candidates = set(min(postings, key=len))
+
+        texts = self._texts
+        matches = {task_id for task_id in candidates if query in texts.get(task_id, "")}
+        self._last_query = query
+        self._last_matches = matches
+        return matches
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Compact binary snapshot format for plan state
+Fixed-size packed task records plus a shared string table, readable through mmap
+"""
+
+import json
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Configuration
+SNAPSHOT_FILE = "enhanced_plan_state.snap"
+
+MAGIC = b"CDTSNAP\x00"
+FORMAT_VERSION = 1
+# magic, format version, reserved, task count, string count, strings offset, meta offset, meta length
+HEADER = struct.Struct("<8sHHIIQQI")
+# id, day, hours, created_order, status code, done, reserved, category, title, notes, completed_date (-1 = None)
+RECORD = struct.Struct("<qidqBBHIIIi")
+OFFSET = struct.Struct("<I")
+
+# Status codes are positions in this list; append new statuses, never reorder
+STATUS_CODES = ["pending", "in_progress", "completed", "skipped"]
+STATUS_INDEX = {value: code for code, value in enumerate(STATUS_CODES)}
+
+
+def write_snapshot(path: str, meta: Dict, tasks: Iterable[Dict]) -> int:
+    """Write a binary snapshot of the plan; returns the number of tasks written"""
+    strings: List[bytes] = []
+    string_index: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        code = string_index.get(value)
+        if code is None:
+            code = string_index[value] = len(strings)
+            strings.append(value.encode('utf-8'))
+        return code
+
+    with open(path, 'wb') as f:
+        f.write(b"\x00" * HEADER.size)  # Filled in once the counts are known
+
+        count = 0
+        for task in tasks:
+            completed_date = task.get("completed_date")
+            f.write(RECORD.pack(
+                task["id"],
+                task["day"],
+                float(task["hours"]),
+                task["created_order"],
+                STATUS_INDEX[task["status"]],
+                1 if task["done"] else 0,
+                0,
+                intern(task.get("category") or ""),
+                intern(task["title"]),
+                intern(task.get("notes") or ""),
+                intern(completed_date) if completed_date is not None else -1
+            ))
+            count += 1
+
+        # String table: offsets (relative to the blob start) followed by the UTF-8 blob
+        strings_offset = f.tell()
+        position = 0
+        for value in strings:
+            f.write(OFFSET.pack(position))
+            position += len(value)
+        f.write(OFFSET.pack(position))
+        for value in strings:
+            f.write(value)
+
+        meta_bytes = json.dumps(meta, separators=(",", ":")).encode('utf-8')
+        meta_offset = f.tell()
+        f.write(meta_bytes)
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, count, len(strings), strings_offset, meta_offset, len(meta_bytes)))
+        f.flush()
+        os.fsync(f.fileno())
+    return count
+
+
+def is_snapshot(path: str) -> bool:
+    """Check whether a file starts with the snapshot magic bytes"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class SnapshotReader:
+    """Random-access reader over a snapshot file; strings are decoded only when used"""
+
+    def __init__(self, path: str, use_mmap: bool = True):
+        self._file = open(path, 'rb')
+        if use_mmap:
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.data = self._file.read()
+
+        magic, version, _, self.task_count, self.string_count, strings_offset, meta_offset, meta_length = \
+            HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a plan snapshot")
+        if version > FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{path} uses snapshot format {version}; this version reads up to {FORMAT_VERSION}")
+
+        self._offsets_start = strings_offset
+        self._blob_start = strings_offset + (self.string_count + 1) * OFFSET.size
+        self._strings: Dict[int, str] = {}
+        self.meta = json.loads(bytes(self.data[meta_offset:meta_offset + meta_length]).decode('utf-8'))
+
+    def __len__(self) -> int:
+        return self.task_count
+
+    def string(self, code: int) -> str:
+        """Decode one entry of the string table"""
+        value = self._strings.get(code)
+        if value is None:
+            start, end = struct.unpack_from("<II", self.data, self._offsets_start + code * OFFSET.size)
+            value = self._strings[code] = bytes(self.data[self._blob_start + start:self._blob_start + end]).decode('utf-8')
+        return value
+
+    def record(self, index: int) -> Tuple:
+        """Get the raw packed fields of one task"""
+        return RECORD.unpack_from(self.data, HEADER.size + index * RECORD.size)
+
+    def task(self, index: int) -> Dict:
+        """Get one task as a plain record dict"""
+        return self._to_dict(self.record(index))
+
+    def _to_dict(self, fields: Tuple) -> Dict:
+        task_id, day, hours, created_order, status, done, _, category, title, notes, completed_date = fields
+        return {
+            "id": task_id,
+            "title": self.string(title),
+            "hours": hours,
+            "day": day,
+            "done": bool(done),
+            "created_order": created_order,
+            "status": STATUS_CODES[status],
+            "notes": self.string(notes),
+            "completed_date": self.string(completed_date) if completed_date >= 0 else None,
+            "category": self.string(category)
+        }
+
+    def __iter__(self) -> Iterator[Dict]:
+        # A full scan touches every string anyway, so decode the table in one pass
+        offsets = struct.unpack_from(f"<{self.string_count + 1}I", self.data, self._offsets_start)
+        blob = bytes(self.data[self._blob_start:self._blob_start + offsets[-1]])
+        strings = [blob[start:end].decode('utf-8') for start, end in zip(offsets, offsets[1:])]
+        statuses = STATUS_CODES
+
+        end = HEADER.size + self.task_count * RECORD.size
+        for task_id, day, hours, created_order, status, done, _, category, title, notes, completed_date in \
+                RECORD.iter_unpack(self.data[HEADER.size:end]):
+            yield {
+                "id": task_id,
+                "title": strings[title],
+                "hours": hours,
+                "day": day,
+                "done": done == 1,
+                "created_order": created_order,
+                "status": statuses[status],
+                "notes": strings[notes],
+                "completed_date": strings[completed_date] if completed_date >= 0 else None,
+                "category": strings[category]
+            }
+
+    def close(self):
+        """Release the mapping and file handle"""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_snapshot(path: str, use_mmap: bool = True) -> Tuple[Dict, List[Dict]]:
+    """Read a whole snapshot; returns (meta, task records)"""
+    with SnapshotReader(path, use_mmap) as reader:
+        return reader.meta, list(reader)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Pluggable storage backends for the tracker
+Provides a SQLite store with per-task row updates and a one-shot JSON migrator
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .journal import PlanJournal, JOURNAL_FILE
+
+# Configuration
+DB_FILE = "enhanced_plan_state.db"
+# Plan files to migrate, highest priority first (the same order as the tracker's PLAN_SOURCES)
+JSON_SOURCES = ["my_schedule.json", "my_plan_data.json", "personal_plan.json", "user_data.json",
+                "plan_data.json", "enhanced_plan_state.json"]
+
+TASK_COLUMNS = ["id", "title", "hours", "day", "done", "created_order",
+                "status", "notes", "completed_date", "category"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS plan_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    hours REAL NOT NULL,
+    day INTEGER NOT NULL,
+    done INTEGER NOT NULL,
+    created_order INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    notes TEXT NOT NULL DEFAULT '',
+    completed_date TEXT,
+    category TEXT
+);
+CREATE TABLE IF NOT EXISTS status_history (
+    task_id INTEGER NOT NULL,
+    old_status TEXT,
+    new_status TEXT NOT NULL,
+    changed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_task ON status_history(task_id);
+"""
+
+
+class PlanStore:
+    """Interface every storage backend implements; records are plain task dicts"""
+
+    def load(self) -> Tuple[Dict, List[Dict]]:
+        """Return (plan metadata, task records) from storage"""
+        raise NotImplementedError
+
+    def save(self, meta: Dict, tasks: List[Dict]):
+        """Replace the stored plan with the given metadata and tasks"""
+        raise NotImplementedError
+
+    def update_task(self, task: Dict):
+        """Persist changes to a single task"""
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resources held by the store"""
+        pass
+
+
+class SQLitePlanStore(PlanStore):
+    def __init__(self, path: str = DB_FILE):
+        self.path = path
+        # The tracker may be handed to another thread after loading (the API's worker thread);
+        # callers still use it from one thread at a time
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def load(self) -> Tuple[Dict, List[Dict]]:
+        """Return (plan metadata, task records) from the database"""
+        meta = {key: json.loads(value) for key, value in self.conn.execute("SELECT key, value FROM plan_meta")}
+        rows = self.conn.execute(
+            f"SELECT {', '.join(TASK_COLUMNS)} FROM tasks ORDER BY created_order, id"
+        )
+        tasks = []
+        for row in rows:
+            task = dict(zip(TASK_COLUMNS, row))
+            task["done"] = bool(task["done"])
+            tasks.append(task)
+        return meta, tasks
+
+    def save(self, meta: Dict, tasks: List[Dict]):
+        """Replace the stored plan in a single transaction"""
+        placeholders = ", ".join("?" for _ in TASK_COLUMNS)
+        with self.conn:
+            self.conn.execute("DELETE FROM plan_meta")
+            self.conn.executemany(
+                "INSERT INTO plan_meta (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in meta.items()]
+            )
+            self.conn.execute("DELETE FROM tasks")
+            self.conn.executemany(
+                f"INSERT INTO tasks ({', '.join(TASK_COLUMNS)}) VALUES ({placeholders})",
+                [tuple(task.get(column) for column in TASK_COLUMNS) for task in tasks]
+            )
+
+    def update_task(self, task: Dict):
+        """Update one task row and record any status change"""
+        with self.conn:
+            row = self.conn.execute("SELECT status FROM tasks WHERE id = ?", (task["id"],)).fetchone()
+            if row is None:
+                placeholders = ", ".join("?" for _ in TASK_COLUMNS)
+                self.conn.execute(
+                    f"INSERT INTO tasks ({', '.join(TASK_COLUMNS)}) VALUES ({placeholders})",
+                    tuple(task.get(column) for column in TASK_COLUMNS)
+                )
+                old_status = None
+            else:
+                columns = [column for column in TASK_COLUMNS if column != "id"]
+                self.conn.execute(
+                    f"UPDATE tasks SET {', '.join(f'{column} = ?' for column in columns)} WHERE id = ?",
+                    tuple(task.get(column) for column in columns) + (task["id"],)
+                )
+                old_status = row[0]
+
+            if old_status != task["status"]:
+                self.conn.execute(
+                    "INSERT INTO status_history (task_id, old_status, new_status, changed_at) VALUES (?, ?, ?, ?)",
+                    (task["id"], old_status, task["status"], datetime.now().isoformat())
+                )
+
+    def status_history(self, task_id: int) -> List[Dict]:
+        """Get the recorded status changes for a task, oldest first"""
+        rows = self.conn.execute(
+            "SELECT old_status, new_status, changed_at FROM status_history WHERE task_id = ? ORDER BY rowid",
+            (task_id,)
+        )
+        return [{"old_status": old, "new_status": new, "changed_at": at} for old, new, at in rows]
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+
+def migrate_json_to_store(store: PlanStore, json_sources: List[str], journal_path: str = JOURNAL_FILE) -> Optional[str]:
+    """Copy the first readable JSON plan (plus any pending journal records) into a store; returns its path"""
+    for source in json_sources:
+        if not os.path.exists(source):
+            continue
+
+        try:
+            with open(source, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            tasks = []
+            for task_data in data.get("tasks", []):
+                task = {column: task_data.get(column) for column in TASK_COLUMNS}
+                task["hours"] = float(task["hours"])
+                task["status"] = task_data.get("status", "completed" if task_data["done"] else "pending")
+                task["notes"] = task_data.get("notes", "")
+                tasks.append(task)
+        except Exception as e:
+            print(f"❌ Error migrating {source}: {e}")
+            continue
+
+        # Pending journal records are not in the snapshot yet
+        tasks_by_id = {task["id"]: task for task in tasks}
+        for record in PlanJournal(journal_path).replay(data.get("plan_id")):
+            task = tasks_by_id.get(record.get("id"))
+            if record.get("op") == "update" and task is not None:
+                task.update(record.get("fields", {}))
+
+        meta = {key: value for key, value in data.items() if key != "tasks"}
+        store.save(meta, tasks)
+        print(f"✅ Migrated {len(tasks)} tasks from {source}")
+        return source
+
+    return None
+
+
+def migrate_json_to_sqlite(db_path: str = DB_FILE, plan_dir: str = ".") -> bool:
+    """Copy the plan in plan_dir (plus any pending journal records) into a SQLite store in the same directory"""
+    store = SQLitePlanStore(os.path.join(plan_dir, db_path))
+    try:
+        sources = [os.path.join(plan_dir, name) for name in JSON_SOURCES]
+        if migrate_json_to_store(store, sources, os.path.join(plan_dir, JOURNAL_FILE)) is None:
+            print("❌ No JSON plan found to migrate")
+            return False
+        return True
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    migrate_json_to_sqlite()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Working-day calendar arithmetic for plans that skip selected weekdays
+Counts and offsets are computed from whole weeks plus a per-weekday remainder table
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Optional, Sequence
+
+
+class WorkingDayCalendar:
+    def __init__(self, skip_days: Sequence[int] = ()):
+        self.skip_days = tuple(sorted(set(skip_days)))
+        working = [weekday not in self.skip_days for weekday in range(7)]
+        self.working_per_week = sum(working)
+
+        # prefix[w][r]: working days among r consecutive days starting on weekday w
+        self._prefix = []
+        # offsets[w][j]: days after a weekday-w date until its (j+1)-th following working day
+        self._offsets = []
+        for weekday in range(7):
+            counts = [0]
+            offsets = []
+            for r in range(1, 8):
+                is_working = working[(weekday + r - 1) % 7]
+                counts.append(counts[-1] + is_working)
+                if working[(weekday + r) % 7]:
+                    offsets.append(r)
+            self._prefix.append(counts)
+            self._offsets.append(offsets)
+
+    def working_days_between(self, start_date, end_date) -> int:
+        """Count working days from start_date to end_date, inclusive"""
+        span = (end_date - start_date).days + 1
+        if span <= 0:
+            return 0
+        full_weeks, remainder = divmod(span, 7)
+        return full_weeks * self.working_per_week + self._prefix[start_date.weekday()][remainder]
+
+    def working_day_date(self, start, working_day: int):
+        """Get the date of working day N, where day 1 is the start date itself"""
+        steps = working_day - 1
+        if steps <= 0 or self.working_per_week == 0:
+            return start
+        full_weeks, remainder = divmod(steps - 1, self.working_per_week)
+        return start + timedelta(days=full_weeks * 7 + self._offsets[start.weekday()][remainder])
+
+    def working_day_dates(self, start, working_days: Iterable[int]) -> List:
+        """Map many working-day numbers to dates in one call"""
+        per_week = self.working_per_week
+        offsets = self._offsets[start.weekday()]
+        if per_week == 0:
+            return [start for _ in working_days]
+
+        dates = []
+        for working_day in working_days:
+            steps = working_day - 1
+            if steps <= 0:
+                dates.append(start)
+                continue
+            full_weeks, remainder = divmod(steps - 1, per_week)
+            dates.append(start + timedelta(days=full_weeks * 7 + offsets[remainder]))
+        return dates
+
+
+def plan_day(start_date: Optional[str], total_days: int, calendar: WorkingDayCalendar, today: Optional[date] = None) -> int:
+    """Get the plan day number for today, given the plan's YYYY-MM-DD start date"""
+    if not start_date:
+        return 1
+
+    start = datetime.strptime(start_date, "%Y-%m-%d").date()
+    current = today or date.today()
+
+    # If we're on the start date, we're on day 1
+    if current <= start:
+        return 1
+
+    if calendar.skip_days:
+        # Calculate working days only (excluding selected days)
+        working_days = calendar.working_days_between(start, current)
+        return min(max(working_days + 1, 1), total_days)
+    # Calculate all days including weekends
+    days_since_start = (current - start).days + 1
+    return min(max(days_since_start, 1), total_days)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Workspace of named plans, one directory per plan
+Plans load on first access and the least recently used ones are closed past a bound; rollups
+read a small per-plan summary file and only load plans whose files changed since it was written
+"""
+
+import json
+import os
+from collections import OrderedDict
+from datetime import date
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .core import EnhancedCybersecurityTracker, USE_JOURNAL
+from .workdays import WorkingDayCalendar, plan_day
+
+# Configuration
+WORKSPACE_DIR = "plans"
+MAX_LOADED_PLANS = 8  # Plans kept in memory; opening one more closes the least recently used
+PLAN_SUMMARY_FILE = "plan_summary.json"  # Written next to each plan's files when it is closed or summarized
+
+
+@lru_cache(maxsize=None)
+def _calendar(skip_days: Tuple[int, ...]) -> WorkingDayCalendar:
+    return WorkingDayCalendar(skip_days)
+
+
+class PlanWorkspace:
+    def __init__(self, root: str = WORKSPACE_DIR, max_loaded: int = MAX_LOADED_PLANS, use_journal: bool = USE_JOURNAL):
+        self.root = root
+        self.max_loaded = max(1, max_loaded)
+        self.use_journal = use_journal
+        # Loaded plans, least recently used first
+        self._loaded: "OrderedDict[str, EnhancedCybersecurityTracker]" = OrderedDict()
+        os.makedirs(root, exist_ok=True)
+
+    # Plans
+
+    def plan_names(self) -> List[str]:
+        """Get the names of all plans in the workspace"""
+        return sorted(entry.name for entry in os.scandir(self.root)
+                      if entry.is_dir() and not entry.name.startswith("."))
+
+    def plan_dir(self, name: str) -> str:
+        """Get the directory holding a plan's files"""
+        if not name or name.startswith(".") or "/" in name or "\\" in name:
+            raise ValueError(f"Invalid plan name {name!r}")
+        return os.path.join(self.root, name)
+
+    def create_plan(self, name: str) -> EnhancedCybersecurityTracker:
+        """Create a plan from the template and load it"""
+        path = self.plan_dir(name)
+        if os.path.exists(path):
+            raise ValueError(f"Plan {name!r} already exists")
+        os.makedirs(path)
+        return self.get(name)
+
+    def get(self, name: str) -> EnhancedCybersecurityTracker:
+        """Get a plan's tracker, loading it on first access"""
+        tracker = self._loaded.get(name)
+        if tracker is not None:
+            self._loaded.move_to_end(name)
+            return tracker
+
+        path = self.plan_dir(name)
+        if not os.path.isdir(path):
+            raise KeyError(name)
+        tracker = EnhancedCybersecurityTracker(use_journal=self.use_journal, plan_dir=path)
+        self._loaded[name] = tracker
+        while len(self._loaded) > self.max_loaded:
+            self.evict(next(iter(self._loaded)))
+        return tracker
+
+    def loaded_names(self) -> List[str]:
+        """Get the names of the plans in memory, least recently used first"""
+        return list(self._loaded)
+
+    def evict(self, name: str) -> bool:
+        """Close a loaded plan, leaving an up-to-date summary file behind"""
+        tracker = self._loaded.pop(name, None)
+        if tracker is None:
+            return False
+        self._close(tracker)
+        return True
+
+    def close(self):
+        """Close every loaded plan"""
+        for name in list(self._loaded):
+            self.evict(name)
+
+    # Rollups
+
+    def plan_digest(self, name: str) -> Dict:
+        """Get the stored facts a rollup needs about one plan, loading it only if its summary is stale"""
+        tracker = self._loaded.get(name)
+        if tracker is not None:
+            # Summarizing is not a use, so the LRU order is left alone
+            return self._digest(tracker)
+
+        path = self.plan_dir(name)
+        digest = self._read_digest(path)
+        if digest is None:
+            # Load just long enough to summarize, without displacing the plans in use
+            digest = self._close(EnhancedCybersecurityTracker(use_journal=self.use_journal, plan_dir=path))
+        return digest
+
+    def plan_status(self, name: str, today: Optional[date] = None) -> Dict:
+        """Get a plan's completion and how many of its tasks are behind schedule"""
+        digest = self.plan_digest(name)
+        summary = digest["summary"]
+        calendar = _calendar(tuple(sorted(set(digest["skip_days"]))))
+        current_day = plan_day(digest["start_date"], digest["total_days"], calendar, today)
+        return {
+            "name": name,
+            "current_day": current_day,
+            "total_days": digest["total_days"],
+            "total_tasks": summary["total_tasks"],
+            "completed": summary["completed"],
+            "completion_percentage": summary["completion_percentage"],
+            "total_hours": summary["total_hours"],
+            "completed_hours": summary["completed_hours"],
+            "behind": sum(count for day, count in digest["pending_by_day"] if day < current_day)
+        }
+
+    def rollup(self, today: Optional[date] = None) -> Dict:
+        """Get per-plan and workspace-wide completion and behind-schedule counts"""
+        plans = [self.plan_status(name, today) for name in self.plan_names()]
+        total_tasks = sum(plan["total_tasks"] for plan in plans)
+        completed = sum(plan["completed"] for plan in plans)
+        return {
+            "plans": plans,
+            "total_tasks": total_tasks,
+            "completed": completed,
+            "completion_percentage": round((completed / total_tasks) * 100, 1) if total_tasks > 0 else 0,
+            "behind": sum(plan["behind"] for plan in plans),
+            "plans_behind": sum(1 for plan in plans if plan["behind"])
+        }
+
+    # Summary files
+
+    def _digest(self, tracker: EnhancedCybersecurityTracker) -> Dict:
+        pending_by_day: Dict[int, int] = {}
+        for task in tracker.tasks:
+            if not task.done:
+                pending_by_day[task.day] = pending_by_day.get(task.day, 0) + 1
+        return {
+            "start_date": tracker.start_date,
+            "total_days": tracker.total_days,
+            "skip_days": list(tracker.skip_days),
+            "summary": tracker.get_progress_summary(),
+            # Behind-schedule counts depend on today's date, so they are recomputed from these
+            "pending_by_day": sorted(pending_by_day.items())
+        }
+
+    def _close(self, tracker: EnhancedCybersecurityTracker) -> Dict:
+        """Close a tracker and record its summary against the files it left on disk"""
+        digest = self._digest(tracker)
+        tracker.close()
+        path = tracker.plan_dir
+        digest["sources"] = self._sources(path)
+        summary_tmp = os.path.join(path, f"{PLAN_SUMMARY_FILE}.tmp")
+        with open(summary_tmp, 'w', encoding='utf-8') as f:
+            json.dump(digest, f)
+        os.replace(summary_tmp, os.path.join(path, PLAN_SUMMARY_FILE))
+        return digest
+
+    def _read_digest(self, path: str) -> Optional[Dict]:
+        """Get a plan's summary file, or None when missing or older than the plan files"""
+        try:
+            with open(os.path.join(path, PLAN_SUMMARY_FILE), 'r', encoding='utf-8') as f:
+                digest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return digest if digest.get("sources") == self._sources(path) else None
+
+    def _sources(self, path: str) -> Dict[str, List[int]]:
+        """Get the modification time and size of every plan file in a plan directory"""
+        sources = {}
+        for entry in os.scandir(path):
+            if entry.is_file() and not entry.name.startswith(PLAN_SUMMARY_FILE):
+                stat = entry.stat()
+                sources[entry.name] = [stat.st_mtime_ns, stat.st_size]
+        return sources
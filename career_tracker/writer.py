@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Background writer that coalesces bursts of save requests into single writes
+Keeps file I/O off the GUI thread
+"""
+
+import threading
+from typing import Callable, Optional
+
+# Configuration
+SAVE_DELAY = 0.5  # Seconds to wait for more changes before writing
+RETRY_DELAY = 1.0  # Seconds before retrying a failed write; doubles after each further failure
+MAX_RETRY_DELAY = 30.0
+
+
+class BackgroundWriter:
+    def __init__(self, write: Callable[[], None], delay: float = SAVE_DELAY):
+        self._write = write
+        self.delay = delay
+        self.last_error: Optional[Exception] = None
+        self._cond = threading.Condition()
+        self._dirty = False
+        self._writing = False
+        self._flush_requests = 0
+        self._flushes_served = 0  # Each flush gets one immediate write attempt, even during a backoff
+        self._stopped = False
+        self._attempts = 0
+        self._failures = 0  # Consecutive failed writes
+        self._thread = threading.Thread(target=self._run, name="plan-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def pending(self) -> bool:
+        """True while a requested write has not finished yet"""
+        with self._cond:
+            return self._dirty or self._writing
+
+    def request(self):
+        """Mark the state dirty; the writer thread saves it after a short delay"""
+        with self._cond:
+            self._dirty = True
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write any pending changes now and wait for them to hit disk; False if the write failed or timed out"""
+        with self._cond:
+            attempts = self._attempts
+            self._flush_requests += 1
+            self._cond.notify_all()
+            # A failed write stays queued for a retry, so stop waiting once one attempt has failed
+            self._cond.wait_for(lambda: not self._writing and (
+                not self._dirty or (self._attempts > attempts and self.last_error is not None)), timeout)
+            return not self._dirty and not self._writing and self.last_error is None
+
+    def stop(self) -> Optional[Exception]:
+        """Flush pending changes and stop the writer thread; returns the error if they could not be saved"""
+        saved = self.flush()
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join()
+        return None if saved else self.last_error
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._dirty or self._stopped)
+                if self._stopped:
+                    # stop() has already flushed; whatever is still dirty failed to save
+                    return
+                # Let a burst of changes settle so they land in one write; back off after failures
+                delay = self.delay
+                if self._failures:
+                    delay = min(RETRY_DELAY * 2 ** (self._failures - 1), MAX_RETRY_DELAY)
+                self._cond.wait_for(lambda: self._flush_requests != self._flushes_served or self._stopped, delay)
+                if self._stopped:
+                    return
+                self._flushes_served = self._flush_requests
+                self._dirty = False
+                self._writing = True
+
+            error = None
+            try:
+                self._write()
+            except Exception as e:
+                error = e
+                print(f"❌ Background save failed: {e}")
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._attempts += 1
+                    self.last_error = error
+                    if error is None:
+                        self._failures = 0
+                    else:
+                        # Keep the changes queued so they are retried instead of lost
+                        self._failures += 1
+                        self._dirty = True
+                    self._cond.notify_all()
@@ -38,6 +38,7 @@ setup(
     entry_points={
         "console_scripts": [
             "cybersecurity-tracker=enhanced_cybersecurity_tracker:main",
+            "tracker=career_tracker.cli:main",
         ],
     },
     keywords="cybersecurity, job-search, certification, security+, planning, productivity",
@@ -0,0 +1,35 @@
+"""Regression tests for backups of state files that a save overwrites"""
+
+import json
+import os
+
+from career_tracker import EnhancedCybersecurityTracker
+
+
+def plan(notes):
+    return {"tasks": [{"id": 1, "title": "Task 1", "hours": 1.0, "day": 1, "done": False, "created_order": 1,
+                       "status": "pending", "notes": notes, "category": "Study"}]}
+
+
+def test_state_file_is_backed_up_before_a_higher_priority_plan_replaces_it(tmp_path):
+    (tmp_path / "enhanced_plan_state.json").write_text(json.dumps(plan("my notes")), encoding='utf-8')
+    (tmp_path / "my_plan_data.json").write_text(json.dumps(plan("")), encoding='utf-8')
+
+    tracker = EnhancedCybersecurityTracker(plan_dir=str(tmp_path))
+    tracker.close()
+
+    backups = [tracker.backups.read(entry["hash"]) for entry in tracker.backups.list_backups()]
+    assert any("my notes" in content for content in backups)
+
+
+def test_legacy_backup_files_are_folded_in_on_start(tmp_path):
+    (tmp_path / "my_schedule.json").write_text(json.dumps(plan("")), encoding='utf-8')
+    os.makedirs(tmp_path / "backups")
+    (tmp_path / "backups" / "backup_20240101_120000.json").write_text(json.dumps(plan("old notes")), encoding='utf-8')
+
+    tracker = EnhancedCybersecurityTracker(plan_dir=str(tmp_path))
+    tracker.close()
+
+    assert not (tmp_path / "backups" / "backup_20240101_120000.json").exists()
+    backups = [tracker.backups.read(entry["hash"]) for entry in tracker.backups.list_backups()]
+    assert any("old notes" in content for content in backups)
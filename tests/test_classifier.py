@@ -0,0 +1,99 @@
+"""Tests for the keyword classifier and for re-applying changed category rules"""
+
+import json
+import os
+import random
+
+from career_tracker import core
+from career_tracker.classifier import CATEGORY_KEYWORDS, KeywordClassifier, load_category_rules, titles_with_keywords
+from career_tracker.core import EnhancedCybersecurityTracker
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORDS = sorted({keyword for _, keywords in CATEGORY_KEYWORDS for keyword in keywords}) + ["coffee", "walk"]
+
+
+def old_categorize_task(title):
+    """The if/elif chain the classifier replaced"""
+    title_lower = title.lower()
+
+    if any(keyword in title_lower for keyword in ["apply", "job", "application"]):
+        return "Applications"
+    elif any(keyword in title_lower for keyword in ["security+", "study", "exam", "practice", "review"]):
+        return "Study"
+    elif any(keyword in title_lower for keyword in ["lab", "tryhackme", "siem", "network", "automation"]):
+        return "Practical Labs"
+    elif any(keyword in title_lower for keyword in ["linkedin", "recruiter", "connect", "networking", "meetup"]):
+        return "Networking"
+    elif any(keyword in title_lower for keyword in ["resume", "github", "portfolio"]):
+        return "Portfolio"
+    elif any(keyword in title_lower for keyword in ["interview", "mock", "star", "prep"]):
+        return "Interview Prep"
+    elif any(keyword in title_lower for keyword in ["follow", "pipeline", "hygiene"]):
+        return "Follow-up"
+    else:
+        return "General"
+
+
+def test_classifier_matches_the_old_if_elif_chain():
+    rng = random.Random(0)
+    # Fragments glue into overlapping keywords, e.g. "net" + "working" or "st" + "ar"
+    fragments = WORDS + ["net", "working", "st", "ar", "pre", "p", "APPLY", "Lab", "-", " ", "review"]
+    titles = ["".join(rng.choice(fragments) for _ in range(rng.randint(0, 6))) for _ in range(5000)]
+    with open(os.path.join(ROOT, "sample_schedule_template.json"), encoding='utf-8') as f:
+        titles += [task["title"] for task in json.load(f)["tasks"]]
+
+    expected = [old_categorize_task(title) for title in titles]
+    for rules in (CATEGORY_KEYWORDS, load_category_rules(os.path.join(ROOT, "category_rules.json"))[0]):
+        classifier = KeywordClassifier(rules)
+        assert [classifier.classify(title) for title in titles] == expected
+        assert classifier.classify_many(titles) == expected
+
+
+def random_rules(rng):
+    categories = [category for category, _ in CATEGORY_KEYWORDS] + ["Extra"]
+    rng.shuffle(categories)
+    return [(category, rng.sample(WORDS, rng.randint(0, 4))) for category in categories[:rng.randint(1, len(categories))]]
+
+
+def test_titles_without_changed_keywords_keep_their_category():
+    rng = random.Random(0)
+    titles = [" ".join(rng.sample(WORDS, rng.randint(0, 4))) for _ in range(300)]
+    for _ in range(300):
+        old = KeywordClassifier(random_rules(rng))
+        new = KeywordClassifier(random_rules(rng))
+        affected = titles_with_keywords(titles, new.changed_keywords(old))
+        for title in titles:
+            if title not in affected:
+                assert old.classify(title) == new.classify(title), title
+
+
+def write_rules(path, lab_category):
+    rules = [{"category": category, "priority": priority, "keywords": keywords}
+             for priority, (category, keywords) in enumerate(CATEGORY_KEYWORDS)]
+    for rule in rules:
+        rule["keywords"] = [keyword for keyword in rule["keywords"] if keyword != "lab"]
+    rules.append({"category": lab_category, "priority": -1, "keywords": ["lab"]})
+    path.write_text(json.dumps({"rules": rules}), encoding='utf-8')
+
+
+def test_rules_changed_while_closed_are_applied_on_load(tmp_path, monkeypatch):
+    rules_file = tmp_path / "category_rules.json"
+    monkeypatch.setattr(core, "CATEGORY_RULES_FILE", str(rules_file))
+    write_rules(rules_file, "Practical Labs")
+    tasks = [{"id": 1, "title": "TryHackMe lab", "hours": 1.0, "day": 1, "done": False, "created_order": 1},
+             {"id": 2, "title": "Home lab", "hours": 1.0, "day": 1, "done": False, "created_order": 2,
+              "category": "Hobbies"},
+             {"id": 3, "title": "Study for exam", "hours": 1.0, "day": 1, "done": False, "created_order": 3}]
+    plan_dir = tmp_path / "plan"
+    plan_dir.mkdir()
+    (plan_dir / "my_schedule.json").write_text(json.dumps({"tasks": tasks}), encoding='utf-8')
+
+    tracker = EnhancedCybersecurityTracker(plan_dir=str(plan_dir))
+    assert [task.category for task in tracker.tasks] == ["Practical Labs", "Hobbies", "Study"]
+    tracker.close()
+
+    write_rules(rules_file, "Study")
+    tracker = EnhancedCybersecurityTracker(plan_dir=str(plan_dir))
+    # Categories set in the plan file are left alone
+    assert [task.category for task in tracker.tasks] == ["Study", "Hobbies", "Study"]
+    tracker.close()
@@ -0,0 +1,24 @@
+"""Regression tests for cohort workers reading plans they do not own"""
+
+import json
+
+from career_tracker.cohort import analyze_plan
+from career_tracker.journal import PlanJournal
+
+
+def test_analyze_plan_applies_the_journal_without_touching_it(tmp_path):
+    tasks = [{"id": i, "title": f"Task {i}", "hours": 1.0, "day": 1, "done": False, "created_order": i,
+              "category": "Study"} for i in range(1, 4)]
+    path = tmp_path / "my_schedule.json"
+    path.write_text(json.dumps({"tasks": tasks}), encoding='utf-8')
+    journal = PlanJournal(str(tmp_path / "enhanced_plan_state.journal"), fsync=False)
+    journal.append("update", 2, {"done": True, "status": "completed"})
+    journal.close()
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"op":"upd')
+    with open(journal.path, 'rb') as f:
+        before = f.read()
+
+    assert analyze_plan(str(path))["completed"] == 1
+    with open(journal.path, 'rb') as f:
+        assert f.read() == before
@@ -0,0 +1,110 @@
+"""Regression tests for journal recovery after a crash and for journals left over from another plan"""
+
+import json
+
+from career_tracker import EnhancedCybersecurityTracker
+from career_tracker.journal import PlanJournal
+
+
+def tear(path):
+    """Simulate a crash that cut the last append short"""
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"op":"update","id":1,"fie')
+
+
+def test_torn_tail_is_cut_off_and_later_appends_replay(tmp_path):
+    path = str(tmp_path / "plan.journal")
+    journal = PlanJournal(path, fsync=False)
+    journal.append("update", 1, {"done": True})
+    journal.close()
+    tear(path)
+
+    recovering = PlanJournal(path, fsync=False)
+    assert [record["id"] for record in recovering.replay()] == [1]
+    recovering.append("update", 2, {"done": True})
+    recovering.append("update", 3, {"done": True})
+    recovering.close()
+
+    assert [record["id"] for record in PlanJournal(path).replay()] == [1, 2, 3]
+
+
+def test_append_after_unterminated_last_record(tmp_path):
+    path = tmp_path / "plan.journal"
+    # A crash between the record and its newline leaves a complete but unterminated line
+    path.write_text('{"op":"update","id":1}', encoding='utf-8')
+
+    journal = PlanJournal(str(path), fsync=False)
+    assert [record["id"] for record in journal.replay()] == [1]
+    journal.append("update", 2)
+    journal.close()
+
+    assert [record["id"] for record in PlanJournal(str(path)).replay()] == [1, 2]
+
+
+def write_schedule(tmp_path, title="Task"):
+    tasks = [{"id": i, "title": f"{title} {i}", "hours": 1.0, "day": 1, "done": False, "created_order": i,
+              "category": "Study"} for i in range(10, 14)]
+    (tmp_path / "my_schedule.json").write_text(json.dumps({"tasks": tasks}), encoding='utf-8')
+    return str(tmp_path)
+
+
+def crash(tracker):
+    """Stop a tracker without the compaction close() does"""
+    tracker.journal.close()
+
+
+def test_tracker_keeps_changes_made_after_a_torn_journal(tmp_path):
+    plan_dir = write_schedule(tmp_path)
+
+    tracker = EnhancedCybersecurityTracker(plan_dir=plan_dir)
+    tracker.toggle_task_status(11)
+    crash(tracker)
+    tear(tracker.journal.path)
+
+    tracker = EnhancedCybersecurityTracker(plan_dir=plan_dir)
+    tracker.toggle_task_status(12)
+    tracker.toggle_task_status(13)
+    tracker.close()
+
+    tracker = EnhancedCybersecurityTracker(plan_dir=plan_dir)
+    assert {task.id for task in tracker.tasks if task.done} == {11, 12, 13}
+    tracker.close()
+
+
+def test_leftover_journal_is_not_replayed_onto_a_new_plan(tmp_path):
+    plan_dir = write_schedule(tmp_path)
+    tracker = EnhancedCybersecurityTracker(plan_dir=plan_dir)
+    tracker.toggle_task_status(11)
+    crash(tracker)
+
+    # A freshly generated plan reuses the same task ids
+    write_schedule(tmp_path, title="New task")
+    tracker = EnhancedCybersecurityTracker(plan_dir=plan_dir)
+    assert not [task.id for task in tracker.tasks if task.done]
+    tracker.close()
+
+
+def test_close_folds_the_journal_into_the_state_files(tmp_path):
+    plan_dir = write_schedule(tmp_path)
+    tracker = EnhancedCybersecurityTracker(plan_dir=plan_dir)
+    tracker.toggle_task_status(11)
+    assert tracker.close() is None
+
+    assert not (tmp_path / "enhanced_plan_state.journal").exists()
+    with open(tmp_path / "my_schedule.json", encoding='utf-8') as f:
+        assert [task["id"] for task in json.load(f)["tasks"] if task["done"]] == [11]
+
+
+def test_read_only_replay_leaves_the_journal_alone(tmp_path):
+    path = str(tmp_path / "plan.journal")
+    journal = PlanJournal(path, fsync=False)
+    journal.append("update", 1, {"done": True})
+    journal.close()
+    tear(path)
+    with open(path, 'rb') as f:
+        before = f.read()
+
+    assert [record["id"] for record in PlanJournal(path).replay(repair=False)] == [1]
+    assert not list(PlanJournal(path).replay("another-plan", repair=False))
+    with open(path, 'rb') as f:
+        assert f.read() == before
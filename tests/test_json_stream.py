@@ -0,0 +1,48 @@
+"""Round-trip tests for the streaming plan reader and writer"""
+
+import io
+import json
+
+import pytest
+
+from career_tracker import json_stream
+from career_tracker.json_stream import read_plan, write_plan
+
+META = {"start_date": "2024-01-01", "total_days": 42, "hours_per_day_target": 6.5, "skip_days": [5, 6],
+        "nested": {"a": [], "b": {}, "c": [1, {"d": None}]}}
+TASKS = [
+    {"id": 1, "title": "Plain", "hours": 1.5, "day": 1, "done": False, "notes": "", "completed_date": None},
+    {"id": 1234567890, "title": "Quotes \" and \\ backslashes, braces {} [] : ,", "hours": 1e-07, "day": -3,
+     "done": True, "notes": "Line one\nLine two\ttabbed", "completed_date": "2024-01-02T10:00:00"},
+    {"id": 3, "title": "Ünïcödé ✅ 🔄 日本語", "hours": 12345.678, "day": 42, "done": False, "tags": [[], [[]]]}
+]
+
+
+def read(text):
+    meta, tasks = read_plan(io.StringIO(text))
+    tasks = list(tasks)
+    return meta, tasks
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7])
+@pytest.mark.parametrize("meta,tasks", [(META, TASKS), ({}, []), (META, []), ({}, TASKS[:1])])
+def test_round_trip_matches_json_dump(monkeypatch, chunk_size, meta, tasks):
+    monkeypatch.setattr(json_stream, "CHUNK_SIZE", chunk_size)
+    plan = dict(meta, tasks=tasks)
+
+    f = io.StringIO()
+    assert write_plan(f, meta, iter(tasks)) == len(tasks)
+    assert f.getvalue() == json.dumps(plan, indent=2)
+    assert read(f.getvalue()) == (meta, tasks)
+
+    f = io.StringIO()
+    write_plan(f, meta, iter(tasks), compact=True)
+    assert f.getvalue() == json.dumps(plan, separators=(",", ":"))
+    assert read(f.getvalue()) == (meta, tasks)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5])
+def test_reads_plans_written_by_json_dump_with_meta_after_the_tasks(monkeypatch, chunk_size):
+    monkeypatch.setattr(json_stream, "CHUNK_SIZE", chunk_size)
+    text = json.dumps({"start_date": "2024-01-01", "tasks": TASKS, "total_days": 10})
+    assert read(text) == ({"start_date": "2024-01-01", "total_days": 10}, TASKS)
@@ -0,0 +1,29 @@
+"""Regression tests for switching between snapshot and JSON state files"""
+
+import json
+
+from career_tracker import core
+from career_tracker.core import EnhancedCybersecurityTracker
+
+
+def test_json_mode_picks_up_changes_saved_in_snapshot_mode(tmp_path, monkeypatch):
+    tasks = [{"id": i, "title": f"Task {i}", "hours": 1.0, "day": 1, "done": False, "created_order": i,
+              "category": "Study"} for i in range(1, 4)]
+    (tmp_path / "my_schedule.json").write_text(json.dumps({"tasks": tasks}), encoding='utf-8')
+    plan_dir = str(tmp_path)
+
+    monkeypatch.setattr(core, "USE_BINARY_SNAPSHOT", True)
+    tracker = EnhancedCybersecurityTracker(plan_dir=plan_dir)
+    tracker.toggle_task_status(2)
+    # Compaction writes the snapshot only
+    tracker.save_state()
+    tracker.close()
+
+    monkeypatch.setattr(core, "USE_BINARY_SNAPSHOT", False)
+    tracker = EnhancedCybersecurityTracker(plan_dir=plan_dir)
+    assert [task.id for task in tracker.tasks if task.done] == [2]
+    tracker.close()
+
+    # The JSON files were brought up to date, so they are used from now on
+    with open(tmp_path / "my_schedule.json", encoding='utf-8') as f:
+        assert [task["id"] for task in json.load(f)["tasks"] if task["done"]] == [2]
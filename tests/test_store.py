@@ -0,0 +1,33 @@
+"""Regression tests for moving a JSON plan into the SQLite store"""
+
+import json
+
+from career_tracker import EnhancedCybersecurityTracker
+from career_tracker.store import SQLitePlanStore, migrate_json_to_sqlite
+
+
+def write_plan(path, title):
+    tasks = [{"id": i, "title": f"{title} {i}", "hours": 1.0, "day": 1, "done": i == 2, "created_order": i,
+              "category": "Study"} for i in range(1, 4)]
+    path.write_text(json.dumps({"tasks": tasks}), encoding='utf-8')
+
+
+def test_empty_store_is_filled_from_the_json_plan(tmp_path):
+    write_plan(tmp_path / "my_schedule.json", "Mine")
+    store = SQLitePlanStore(str(tmp_path / "enhanced_plan_state.db"))
+
+    tracker = EnhancedCybersecurityTracker(store=store, plan_dir=str(tmp_path))
+    assert [task.title for task in tracker.tasks] == ["Mine 1", "Mine 2", "Mine 3"]
+    assert [task.id for task in tracker.tasks if task.done] == [2]
+    tracker.close()
+
+
+def test_migration_reads_the_plan_dir_in_load_order(tmp_path):
+    write_plan(tmp_path / "enhanced_plan_state.json", "State")
+    write_plan(tmp_path / "my_schedule.json", "Mine")
+
+    assert migrate_json_to_sqlite(plan_dir=str(tmp_path))
+    store = SQLitePlanStore(str(tmp_path / "enhanced_plan_state.db"))
+    _, records = store.load()
+    store.close()
+    assert [record["title"] for record in records] == ["Mine 1", "Mine 2", "Mine 3"]
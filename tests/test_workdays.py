@@ -0,0 +1,60 @@
+"""Checks the working-day calendar against the day-by-day loops it replaced"""
+
+from datetime import date, datetime, timedelta
+from itertools import combinations
+
+from career_tracker.workdays import WorkingDayCalendar
+
+START = date(2024, 1, 1)  # A Monday
+
+
+def naive_working_days_between(skip_days, start_date, end_date):
+    working_days = 0
+    current = start_date
+    while current <= end_date:
+        if current.weekday() not in skip_days:
+            working_days += 1
+        current += timedelta(days=1)
+    return working_days
+
+
+def naive_working_day_date(skip_days, start, working_day):
+    current = start
+    day_count = 1
+    while day_count < working_day:
+        current += timedelta(days=1)
+        if not skip_days or current.weekday() not in skip_days:
+            day_count += 1
+    return current
+
+
+def skip_day_combinations():
+    # Skipping every weekday never reaches a later working day, so the old loop never ends
+    return [skip_days for size in range(7) for skip_days in combinations(range(7), size)]
+
+
+def test_working_days_between_matches_the_loop():
+    for skip_days in skip_day_combinations():
+        calendar = WorkingDayCalendar(skip_days)
+        for offset in range(7):
+            start = START + timedelta(days=offset)
+            for span in range(-1, 30):
+                end = start + timedelta(days=span)
+                assert calendar.working_days_between(start, end) == naive_working_days_between(skip_days, start, end), \
+                    (skip_days, start, end)
+
+
+def test_working_day_dates_match_the_loop():
+    for skip_days in skip_day_combinations():
+        calendar = WorkingDayCalendar(skip_days)
+        for offset in range(7):
+            start = datetime.combine(START + timedelta(days=offset), datetime.min.time())
+            expected = [naive_working_day_date(skip_days, start, day) for day in range(0, 30)]
+            assert [calendar.working_day_date(start, day) for day in range(0, 30)] == expected, (skip_days, start)
+            assert calendar.working_day_dates(start, range(0, 30)) == expected, (skip_days, start)
+
+
+def test_skipping_every_day_returns_the_start_date():
+    calendar = WorkingDayCalendar(range(7))
+    assert calendar.working_day_date(START, 10) == START
+    assert calendar.working_days_between(START, START + timedelta(days=30)) == 0
@@ -0,0 +1,37 @@
+"""Regression tests for failed background saves"""
+
+import time
+
+from career_tracker import writer
+from career_tracker.writer import BackgroundWriter
+
+
+def test_failed_write_is_retried(monkeypatch):
+    monkeypatch.setattr(writer, "RETRY_DELAY", 0.01)
+    outcomes = [OSError("disk full"), None]
+
+    def write():
+        error = outcomes.pop(0)
+        if error is not None:
+            raise error
+
+    background = BackgroundWriter(write, delay=0.01)
+    background.request()
+    assert not background.flush()
+    assert background.pending
+
+    deadline = time.monotonic() + 5
+    while background.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not background.pending
+    assert background.stop() is None
+
+
+def test_stop_reports_a_final_save_that_failed():
+    def write():
+        raise OSError("read-only file system")
+
+    background = BackgroundWriter(write, delay=0.01)
+    background.request()
+    error = background.stop()
+    assert isinstance(error, OSError)